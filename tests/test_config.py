@@ -0,0 +1,119 @@
+import copy
+import pickle
+from pathlib import Path
+
+import pytest
+
+from universalagent.core.config import (
+    AgentConfig,
+    LLMConfig,
+    RAGConfig,
+    ToolConfig,
+    TTSConfig,
+)
+
+EXAMPLE_CONFIG = Path(__file__).resolve().parent.parent / "example" / "configs" / "default.json"
+
+
+def _config_data():
+    return {
+        "agent_id": "agent-1",
+        "name": "Survey Agent",
+        "description": "Runs customer surveys",
+        "llm_config": {
+            "provider": "openai",
+            "model": "gpt-4o-mini",
+            "temperature": 0.3,
+            "custom_params": {"top_p": 0.9, "stop": ["\n"]},
+        },
+        "tts_config": {"provider": "cartesia", "voice_id": "voice-1"},
+        "rag_config": {"enabled": True, "knowledge_base_ids": ["kb-1", "kb-2"]},
+        "tools": [
+            {"id": "t1", "name": "end_call"},
+            {"id": "t2", "name": "lookup", "async_execution": True},
+        ],
+        "first_message": "Hello!",
+    }
+
+
+def test_from_dict_builds_nested_configs():
+    config = AgentConfig.from_dict(_config_data())
+
+    assert isinstance(config.llm_config, LLMConfig)
+    assert config.llm_config.custom_params == {"top_p": 0.9, "stop": ["\n"]}
+    assert isinstance(config.tts_config, TTSConfig)
+    assert config.stt_config is None
+    assert isinstance(config.rag_config, RAGConfig)
+    assert [type(tool) for tool in config.tools] == [ToolConfig, ToolConfig]
+    assert config.tools[1].async_execution is True
+    # Missing fields fall back to dataclass defaults
+    assert config.agent_type == "assistant"
+    assert config.tools[0].enabled is True
+
+
+def test_from_dict_round_trips_through_to_dict_and_json():
+    config = AgentConfig.from_dict(_config_data())
+
+    assert AgentConfig.from_dict(config.to_dict()) == config
+    assert AgentConfig.from_json(config.to_json()) == config
+    assert AgentConfig.from_json(config.to_json(indent=4)) == config
+
+
+def test_from_dict_round_trips_example_config():
+    config = AgentConfig.from_json(EXAMPLE_CONFIG.read_text())
+
+    assert AgentConfig.from_json(config.to_json()) == config
+
+
+def test_equal_provider_configs_are_shared():
+    first = AgentConfig.from_dict(_config_data())
+    second = AgentConfig.from_dict(copy.deepcopy(_config_data()))
+
+    assert first.llm_config is second.llm_config
+    assert first.tts_config is second.tts_config
+
+
+def test_shared_config_values_are_read_only():
+    data = _config_data()
+    config = AgentConfig.from_dict(data)
+
+    # Later changes to the source data do not leak into the config
+    data["llm_config"]["custom_params"]["top_p"] = 0.1
+    assert config.llm_config.custom_params["top_p"] == 0.9
+
+    with pytest.raises(TypeError):
+        config.llm_config.custom_params["top_p"] = 0.5
+    with pytest.raises(TypeError):
+        config.llm_config.custom_params["stop"].append("END")
+    with pytest.raises(TypeError):
+        config.rag_config.knowledge_base_ids.append("kb-3")
+
+    # Copies are ordinary mutable containers
+    params = copy.deepcopy(config.llm_config.custom_params)
+    params["top_p"] = 0.5
+    assert config.llm_config.custom_params["top_p"] == 0.9
+
+
+def test_is_valid_agrees_with_validate():
+    valid = AgentConfig.from_dict({**_config_data(), "system_instructions": "Be brief."})
+    assert valid.validate() == []
+    assert valid.is_valid()
+
+    invalid = AgentConfig.from_dict(_config_data())
+    assert invalid.validate() == ["system_instructions is recommended"]
+    assert not invalid.is_valid()
+
+
+def test_shared_configs_are_slotted_hashable_and_copyable():
+    config = AgentConfig.from_dict(_config_data())
+    llm_config = config.llm_config
+
+    assert not hasattr(llm_config, "__dict__")
+    assert hash(llm_config) == hash(AgentConfig.from_dict(_config_data()).llm_config)
+    assert len({llm_config, config.tts_config, config.rag_config}) == 3
+
+    for copied in (pickle.loads(pickle.dumps(llm_config)), copy.deepcopy(llm_config)):
+        assert copied == llm_config
+        assert copied.custom_params == {"top_p": 0.9, "stop": ["\n"]}
+    assert pickle.loads(pickle.dumps(config)) == config
+    assert config.to_dict()["llm_config"]["custom_params"] == {"top_p": 0.9, "stop": ["\n"]}
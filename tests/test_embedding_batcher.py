@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+
+from kb_retriever.embedding_batcher import EmbeddingBatcher
+
+
+class _FakeProvider:
+    def __init__(self, fail: bool = False):
+        self.calls = []
+        self.fail = fail
+
+    async def embed_batch(self, texts):
+        self.calls.append(list(texts))
+        await asyncio.sleep(0)
+        if self.fail:
+            raise RuntimeError("provider down")
+        return [[float(len(text))] for text in texts]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_call():
+    provider = _FakeProvider()
+    batcher = EmbeddingBatcher(provider.embed_batch)
+
+    vectors = await asyncio.gather(*(batcher.embed(text) for text in ["a", "bb", "ccc"]))
+
+    assert vectors == [[1.0], [2.0], [3.0]]
+    assert provider.calls == [["a", "bb", "ccc"]]
+
+
+@pytest.mark.asyncio
+async def test_batches_are_capped_at_max_batch_size():
+    provider = _FakeProvider()
+    batcher = EmbeddingBatcher(provider.embed_batch, max_batch_size=2)
+    texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+
+    vectors = await asyncio.gather(*(batcher.embed(text) for text in texts))
+
+    assert vectors == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+    assert sorted(len(call) for call in provider.calls) == [1, 2, 2]
+    assert sorted(text for call in provider.calls for text in call) == texts
+
+
+@pytest.mark.asyncio
+async def test_sequential_requests_are_not_delayed_into_one_batch():
+    provider = _FakeProvider()
+    batcher = EmbeddingBatcher(provider.embed_batch)
+
+    assert await batcher.embed("a") == [1.0]
+    assert await batcher.embed("bb") == [2.0]
+    assert provider.calls == [["a"], ["bb"]]
+
+
+@pytest.mark.asyncio
+async def test_provider_error_reaches_every_waiter():
+    provider = _FakeProvider(fail=True)
+    batcher = EmbeddingBatcher(provider.embed_batch)
+
+    results = await asyncio.gather(
+        batcher.embed("a"), batcher.embed("b"), return_exceptions=True
+    )
+
+    assert [type(result) for result in results] == [RuntimeError, RuntimeError]
+    assert len(provider.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_short_provider_response_fails_every_waiter():
+    async def drop_last(texts):
+        return [[1.0]] * (len(texts) - 1)
+
+    batcher = EmbeddingBatcher(drop_last)
+
+    results = await asyncio.gather(
+        batcher.embed("a"), batcher.embed("b"), return_exceptions=True
+    )
+
+    assert [type(result) for result in results] == [ValueError, ValueError]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_batch_does_not_leave_waiters_pending():
+    started = asyncio.Event()
+
+    async def hang(texts):
+        started.set()
+        await asyncio.Event().wait()
+
+    batcher = EmbeddingBatcher(hang)
+    waiters = [asyncio.ensure_future(batcher.embed(text)) for text in ["a", "b"]]
+    await started.wait()
+
+    for task in list(batcher._tasks):
+        task.cancel()
+    results = await asyncio.wait_for(asyncio.gather(*waiters, return_exceptions=True), 1)
+
+    assert [type(result) for result in results] == [asyncio.CancelledError] * 2
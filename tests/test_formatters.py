@@ -0,0 +1,29 @@
+from universalagent.transcripts.formatters import HTMLFormatter, MarkdownFormatter
+from universalagent.transcripts.models import Transcript, TranscriptMessage, TranscriptMetadata
+
+
+def _transcript(agent_name: str) -> Transcript:
+    return Transcript(
+        metadata=TranscriptMetadata(call_id="call-1", agent_id="agent-1", agent_name=agent_name),
+        messages=[
+            TranscriptMessage("assistant", "Hello there", False),
+            TranscriptMessage("user", "Hi", True),
+            TranscriptMessage("system", "Call ended", False),
+        ],
+    )
+
+
+def test_markdown_speakers():
+    text = MarkdownFormatter().format(_transcript("Ava"))
+
+    assert "**Ava:** Hello there" in text
+    assert "**Customer:** Hi *(interrupted)*" in text
+    assert "**System:** Call ended" in text
+
+
+def test_empty_agent_name_is_not_replaced_by_role():
+    html = HTMLFormatter().format(_transcript(""))
+
+    assert "<strong>:</strong> Hello there" in html
+    assert "<strong>Assistant:</strong>" not in html
+    assert "<strong>System:</strong> Call ended" in html
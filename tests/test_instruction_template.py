@@ -0,0 +1,29 @@
+import pytest
+
+from universalagent.core.instruction_template import (
+    _compile_string_template,
+    _string_template_env,
+    render_instructions_with_data,
+)
+
+DATA = {"company_name": "Acme", "survey_topic": "billing", "count": 3}
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "You are calling for {{ company_name }} about {{ survey_topic }}.",
+        "{{company_name}}{{ count }} and {{ missing }}",
+        "{{ true }} {{ false }} {{ none }} {{ True }} {{ None }}",
+        "{{ range }} {{ dict }} for {{ company_name }}",
+        "{{ company_name | upper }}",
+        "{% if count %}{{ count }} calls{% endif %}",
+    ],
+)
+def test_fast_path_matches_jinja(template):
+    expected = _string_template_env.from_string(template).render(**DATA)
+    assert _compile_string_template(template)(**DATA) == expected
+
+
+def test_render_without_placeholders_returns_input():
+    assert render_instructions_with_data("No placeholders here.", DATA) == "No placeholders here."
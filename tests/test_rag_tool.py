@@ -0,0 +1,48 @@
+import numpy as np
+
+from kb_retriever import RetrievalResult
+from universalagent.tools.knowledge.rag_tool import RAGToolConfig, _SemanticCache
+
+
+def _result(query: str) -> RetrievalResult:
+    return RetrievalResult(success=True, query_metadata={"query": query})
+
+
+def test_semantic_cache_disabled_by_default():
+    config = RAGToolConfig(openai_api_key="", pinecone_api_key="", index_name="")
+    assert config.semantic_cache_size == 0
+
+
+def test_semantic_cache_hits_identical_query():
+    cache = _SemanticCache(capacity=4, threshold=0.95)
+    embedding = [0.6, 0.8, 0.0]
+    result = _result("opening hours on monday")
+    cache.put(embedding, result)
+
+    assert cache.get(embedding) is result
+    # Scale does not matter, only direction
+    assert cache.get([1.2, 1.6, 0.0]) is result
+
+
+def test_semantic_cache_near_miss_does_not_hit():
+    cache = _SemanticCache(capacity=4, threshold=0.95)
+    monday = np.array([1.0, 0.0, 0.0])
+    # cosine(monday, tuesday) = 0.94, just under the threshold
+    tuesday = np.array([0.94, np.sqrt(1 - 0.94**2), 0.0])
+    cache.put(monday, _result("opening hours on monday"))
+
+    assert cache.get(tuesday) is None
+
+
+def test_semantic_cache_evicts_least_recently_used():
+    cache = _SemanticCache(capacity=2, threshold=0.99)
+    a, b, c = [1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]
+    result_a = _result("a")
+    cache.put(a, result_a)
+    cache.put(b, _result("b"))
+    cache.get(a)
+    cache.put(c, _result("c"))
+
+    assert cache.get(a) is result_a
+    assert cache.get(b) is None
+    assert cache.get(c) is not None
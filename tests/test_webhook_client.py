@@ -0,0 +1,171 @@
+import asyncio
+
+import orjson
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from universalagent.events import webhook_client
+from universalagent.events.webhook_client import BatchingWebhookClient, WebhookClient
+
+
+class _Endpoint:
+    """Local webhook endpoint answering with a scripted list of statuses."""
+
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.bodies = []
+
+    async def handle(self, request):
+        self.bodies.append(orjson.loads(await request.read()))
+        status = self.statuses.pop(0) if len(self.statuses) > 1 else self.statuses[0]
+        return web.Response(status=status)
+
+
+@pytest_asyncio.fixture
+async def serve():
+    servers = []
+
+    async def start(*statuses):
+        endpoint = _Endpoint(statuses)
+        app = web.Application()
+        app.router.add_post("/hook", endpoint.handle)
+        server = TestServer(app)
+        await server.start_server()
+        servers.append(server)
+        return endpoint, str(server.make_url("/hook"))
+
+    yield start
+    for server in servers:
+        await server.close()
+
+
+@pytest.mark.asyncio
+async def test_retries_transient_status(serve):
+    endpoint, url = await serve(503, 200)
+    client = WebhookClient(url, backoff_base=0.001)
+
+    assert await client.send_payload({"n": 1})
+    assert endpoint.bodies == [{"n": 1}, {"n": 1}]
+    assert not client.failed_payloads
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_does_not_retry_client_error(serve):
+    endpoint, url = await serve(400)
+    client = WebhookClient(url, backoff_base=0.001)
+
+    assert not await client.send_payload({"n": 1})
+    assert len(endpoint.bodies) == 1
+    assert list(client.failed_payloads) == [{"n": 1}]
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_circuit_opens_after_consecutive_failures(serve):
+    endpoint, url = await serve(400)
+    client = WebhookClient(url, failure_threshold=5, cooldown_seconds=60)
+
+    for n in range(6):
+        assert not await client.send_payload({"n": n})
+
+    # The sixth payload is buffered without reaching the endpoint
+    assert len(endpoint.bodies) == 5
+    assert len(client.failed_payloads) == 6
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_retry_failed_resends_buffered_payloads(serve):
+    endpoint, url = await serve(400, 200)
+    client = WebhookClient(url)
+
+    assert not await client.send_payload({"n": 1})
+    assert await client.retry_failed() == 1
+    assert not client.failed_payloads
+    assert endpoint.bodies == [{"n": 1}, {"n": 1}]
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_batches_split_by_size_and_tail_flushed_on_close(serve):
+    endpoint, url = await serve(200)
+    client = BatchingWebhookClient(WebhookClient(url), batch_size=3, flush_interval_ms=10_000)
+
+    for n in range(7):
+        assert await client.send_payload({"n": n})
+    await client.aclose()
+
+    assert [len(body["events"]) for body in endpoint.bodies] == [3, 3, 1]
+    events = [event["n"] for body in endpoint.bodies for event in body["events"]]
+    assert events == list(range(7))
+    assert len({body["batch_id"] for body in endpoint.bodies}) == 3
+
+
+
+class _FlakyClient:
+    """Stands in for WebhookClient, raising on the first batch it is given."""
+
+    def __init__(self):
+        self.batches = []
+        self.closed = False
+
+    async def send_payload(self, payload):
+        self.batches.append(payload["events"])
+        if len(self.batches) == 1:
+            raise RuntimeError("boom")
+        return True
+
+    async def aclose(self):
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_flusher_survives_send_error():
+    inner = _FlakyClient()
+    client = BatchingWebhookClient(inner, batch_size=1, flush_interval_ms=10_000)
+
+    await client.send_payload({"n": 1})
+    await client.send_payload({"n": 2})
+    await client.aclose()
+
+    assert inner.batches == [[{"n": 1}], [{"n": 2}]]
+    assert inner.closed
+
+
+@pytest.mark.asyncio
+async def test_dead_flusher_is_restarted():
+    inner = _FlakyClient()
+    client = BatchingWebhookClient(inner, batch_size=1, flush_interval_ms=10_000)
+
+    await client.send_payload({"n": 1})
+    client._flusher.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await client._flusher
+    await client.send_payload({"n": 2})
+    await client.aclose()
+
+    assert inner.batches == [[{"n": 1}], [{"n": 2}]]
+    assert inner.closed
+
+@pytest.mark.asyncio
+async def test_shared_session_closed_after_last_client(serve):
+    _, url = await serve(200)
+    first = WebhookClient(url)
+    second = WebhookClient(url)
+    session = webhook_client._shared_session
+
+    assert second._session is session
+    assert webhook_client._shared_refs == 2
+
+    await first.aclose()
+    assert not session.closed
+    await second.aclose()
+    # A second aclose must not release the session again
+    await second.aclose()
+
+    assert webhook_client._shared_refs == 0
+    assert webhook_client._shared_session is None
+    assert session.closed
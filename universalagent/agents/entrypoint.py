@@ -38,6 +38,9 @@ from mem0 import AsyncMemoryClient
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on how long session teardown waits for the transcript/metrics webhooks
+SHUTDOWN_WEBHOOK_TIMEOUT = 15.0
+
 
 async def configurable_agent_entrypoint(ctx: JobContext) -> None:
     """Universal entrypoint for configurable agents.
@@ -107,11 +110,32 @@ async def start_agent_session(ctx: JobContext, config: AgentConfig, meta: CallMe
             event_sender = EventSender(
                 transcript_webhook_url=os.getenv("COMPLETION_WEBHOOK_URL"),
                 metrics_webhook_url=os.getenv("COMPLETION_WEBHOOK_URL"),
+                batch_size=int(os.getenv("WEBHOOK_BATCH_SIZE", 0)) or None,
+                flush_interval_ms=int(os.getenv("WEBHOOK_FLUSH_INTERVAL_MS", 500)),
             )
-            await event_sender.send_transcript(session, transcript_metadata)
             summary = usage_collector.get_summary()
-            await event_sender.send_metrics(summary, meta.to_dict())
-            await event_sender.aclose()
+            try:
+                # Transcript and metrics go out concurrently over the shared session.
+                # Retries against a down endpoint could otherwise hold teardown for minutes.
+                await asyncio.wait_for(
+                    asyncio.gather(
+                        event_sender.send_transcript(session, transcript_metadata),
+                        event_sender.send_metrics(summary, meta.to_dict()),
+                    ),
+                    timeout=SHUTDOWN_WEBHOOK_TIMEOUT,
+                )
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"Webhook sends did not finish within {SHUTDOWN_WEBHOOK_TIMEOUT}s of shutdown"
+                )
+            finally:
+                try:
+                    # Batched events are posted while the sender drains on close
+                    await asyncio.wait_for(event_sender.aclose(), timeout=SHUTDOWN_WEBHOOK_TIMEOUT)
+                except asyncio.TimeoutError:
+                    logger.warning(
+                        f"Webhook sender did not drain within {SHUTDOWN_WEBHOOK_TIMEOUT}s of shutdown"
+                    )
 
         ctx.add_shutdown_callback(event_sender_shutdown_callback)
 
@@ -5,7 +5,8 @@ Only the fields we actually use today are modelled.
 
 from dataclasses import dataclass, field, asdict
 from typing import Any, Dict, Optional
-import json
+
+import orjson
 
 
 @dataclass
@@ -27,7 +28,7 @@ class CallMetadata:
     # -------- convenience helpers ---------------------------------
     @classmethod
     def from_json(cls, json_str: str | None) -> "CallMetadata":
-        data: Dict[str, Any] = json.loads(json_str) if json_str else {}
+        data: Dict[str, Any] = orjson.loads(json_str) if json_str else {}
         return cls(
             agent_id=data.get("agent_id", "default"),
             call_id=data.get("call_id", "unknown_call"),
@@ -5,7 +5,7 @@ This package provides the fundamental configuration structures and utilities
 for building flexible, configuration-driven voice AI agents with LiveKit.
 """
 
-# Configuration classes and enums
+# Configuration classes and provider/type names
 from .config import (
     AgentConfig,
     LLMConfig,
@@ -20,6 +20,11 @@ from .config import (
     STTProvider,
     RAGProvider,
     NoiseCancellationType,
+    LLM_PROVIDERS,
+    TTS_PROVIDERS,
+    STT_PROVIDERS,
+    RAG_PROVIDERS,
+    NOISE_CANCELLATION_TYPES,
 )
 
 # Configuration loading utilities
@@ -46,12 +51,17 @@ __all__ = [
     "MemoryConfig",
     "ToolConfig",
     "WebhookConfig",
-    # Enums
+    # Provider and type names
     "LLMProvider",
     "TTSProvider",
     "STTProvider",
     "RAGProvider",
     "NoiseCancellationType",
+    "LLM_PROVIDERS",
+    "TTS_PROVIDERS",
+    "STT_PROVIDERS",
+    "RAG_PROVIDERS",
+    "NOISE_CANCELLATION_TYPES",
     # Configuration loaders
     "ConfigurationLoader",
     "load_config_from_file",
@@ -5,60 +5,61 @@ This module defines all configuration structures needed to set up
 and run configurable voice AI agents with LiveKit.
 """
 
-from dataclasses import dataclass, field
-from typing import Dict, Any, Optional, List, Union
-from enum import Enum
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import MISSING, dataclass, field, fields, is_dataclass
+from typing import Dict, Any, Final, Iterator, Literal, Optional, List, Union, get_args, get_origin
 import json
 import logging
+import sys
+import weakref
 
-logger = logging.getLogger(__name__)
-
-
-class LLMProvider(Enum):
-    """Supported LLM providers."""
-
-    OPENAI = "openai"
-    ANTHROPIC = "anthropic"
-    LOCAL = "local"
-
-
-class TTSProvider(Enum):
-    """Supported TTS providers."""
-
-    ELEVENLABS = "elevenlabs"
-    CARTESIA = "cartesia"
-    OPENAI = "openai"
-
+from universalagent.core.serialization import dumps_json
 
-class STTProvider(Enum):
-    """Supported STT providers."""
-
-    ELEVENLABS = "elevenlabs"
-    DEEPGRAM = "deepgram"
-    OPENAI = "openai"
+logger = logging.getLogger(__name__)
 
+# Whether __post_init__ validators run; switched off by skip_validation()
+_validate_on_init: ContextVar[bool] = ContextVar("_validate_on_init", default=True)
 
-class RAGProvider(Enum):
-    """Supported RAG providers."""
+# Shared instances of frozen provider configs, keyed by (class, field values)
+_interned: "weakref.WeakValueDictionary[Any, Any]" = weakref.WeakValueDictionary()
 
-    PINECONE = "pinecone"
-    CHROMA = "chroma"
-    LLAMAINDEX = "llamaindex"
+# Interned configs need a __weakref__ slot, which dataclasses only add from Python
+# 3.11; slotted frozen dataclasses also cannot be pickled on 3.10, so they keep a
+# __dict__ there
+_FROZEN_SLOTS: Final = {"slots": True, "weakref_slot": True} if sys.version_info >= (3, 11) else {}
 
 
-class NoiseCancellationType(Enum):
-    """Noise cancellation types."""
+@contextmanager
+def skip_validation() -> Iterator[None]:
+    """Skip ``__post_init__`` validation for configs built inside this block.
 
-    BVC = "BVC"
-    BVC_TELEPHONY = "BVCTelephony"
-    NONE = "none"
+    Use this only for configs coming from a trusted source that has already
+    validated them (e.g. the agent configuration table). Regular
+    ``AgentConfig(...)`` construction keeps validating by default.
+    """
+    token = _validate_on_init.set(False)
+    try:
+        yield
+    finally:
+        _validate_on_init.reset(token)
 
 
-class ToolType(Enum):
-    """Tool types."""
+# Supported provider and type names. These are plain strings in the JSON configs,
+# so membership is checked against frozensets instead of Enum values.
+LLMProvider = Literal["openai", "anthropic", "local"]
+TTSProvider = Literal["elevenlabs", "cartesia", "openai"]
+STTProvider = Literal["elevenlabs", "deepgram", "openai"]
+RAGProvider = Literal["pinecone", "chroma", "llamaindex"]
+NoiseCancellationType = Literal["BVC", "BVCTelephony", "none"]
+ToolType = Literal["default", "webhook"]
 
-    DEFAULT = "default"
-    WEBHOOK = "webhook"
+LLM_PROVIDERS: Final = frozenset(get_args(LLMProvider))
+TTS_PROVIDERS: Final = frozenset(get_args(TTSProvider))
+STT_PROVIDERS: Final = frozenset(get_args(STTProvider))
+RAG_PROVIDERS: Final = frozenset(get_args(RAGProvider))
+NOISE_CANCELLATION_TYPES: Final = frozenset(get_args(NoiseCancellationType))
+TOOL_TYPES: Final = frozenset(get_args(ToolType))
 
 
 @dataclass
@@ -71,74 +72,83 @@ class ApiSpec:
     body: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(frozen=True, **_FROZEN_SLOTS)
 class LLMConfig:
     """Configuration for Language Model providers."""
 
-    provider: str
+    provider: LLMProvider
     model: str
     temperature: float = 0.7
     max_tokens: Optional[int] = None
     api_key: Optional[str] = None
     base_url: Optional[str] = None
-    custom_params: Dict[str, Any] = field(default_factory=dict)
+    custom_params: Dict[str, Any] = field(default_factory=dict, hash=False)
 
     def __post_init__(self):
         """Validate configuration after initialization."""
-        if self.provider not in [p.value for p in LLMProvider]:
+        if not _validate_on_init.get():
+            return
+
+        if self.provider not in LLM_PROVIDERS:
             logger.warning(f"Unknown LLM provider: {self.provider}")
 
         if self.temperature < 0 or self.temperature > 2:
             raise ValueError("Temperature must be between 0 and 2")
 
 
-@dataclass
+@dataclass(frozen=True, **_FROZEN_SLOTS)
 class TTSConfig:
     """Configuration for Text-to-Speech providers."""
 
-    provider: str
+    provider: TTSProvider
     voice_id: Optional[str] = None
     model: Optional[str] = None
     language: str = "en"
     speed: float = 1.0
     api_key: Optional[str] = None
-    custom_params: Dict[str, Any] = field(default_factory=dict)
+    custom_params: Dict[str, Any] = field(default_factory=dict, hash=False)
 
     def __post_init__(self):
         """Validate configuration after initialization."""
-        if self.provider not in [p.value for p in TTSProvider]:
+        if not _validate_on_init.get():
+            return
+
+        if self.provider not in TTS_PROVIDERS:
             logger.warning(f"Unknown TTS provider: {self.provider}")
 
         if self.speed < 0.25 or self.speed > 4.0:
             raise ValueError("Speed must be between 0.25 and 4.0")
 
 
-@dataclass
+@dataclass(frozen=True, **_FROZEN_SLOTS)
 class STTConfig:
     """Configuration for Speech-to-Text providers."""
 
-    provider: str
+    provider: STTProvider
     language: str = "en"
     model: Optional[str] = None
     api_key: Optional[str] = None
-    custom_params: Dict[str, Any] = field(default_factory=dict)
+    custom_params: Dict[str, Any] = field(default_factory=dict, hash=False)
 
     def __post_init__(self):
         """Validate configuration after initialization."""
-        if self.provider not in [p.value for p in STTProvider]:
+        if not _validate_on_init.get():
+            return
+
+        if self.provider not in STT_PROVIDERS:
             logger.warning(f"Unknown STT provider: {self.provider}")
 
 
-@dataclass
+@dataclass(frozen=True, **_FROZEN_SLOTS)
 class RAGConfig:
     """Configuration for Retrieval-Augmented Generation."""
 
     enabled: bool = False
     namespace: Optional[str] = None
-    knowledge_base_ids: Optional[List[str]] = None
+    knowledge_base_ids: Optional[List[str]] = field(default=None, hash=False)
 
 
-@dataclass
+@dataclass(frozen=True, **_FROZEN_SLOTS)
 class MemoryConfig:
     """Configuration for conversation memory management."""
 
@@ -147,10 +157,13 @@ class MemoryConfig:
     max_history: int = 50
     summarize_threshold: int = 100
     provider: Optional[str] = None
-    custom_params: Dict[str, Any] = field(default_factory=dict)
+    custom_params: Dict[str, Any] = field(default_factory=dict, hash=False)
 
     def __post_init__(self):
         """Validate configuration after initialization."""
+        if not _validate_on_init.get():
+            return
+
         valid_types = ["conversation", "user", "global"]
         if self.type not in valid_types:
             raise ValueError(f"Memory type must be one of: {valid_types}")
@@ -171,7 +184,7 @@ class ToolConfig:
     enabled: bool = True
     async_execution: bool = False
     description: Optional[str] = None
-    type: ToolType = ToolType.DEFAULT
+    type: ToolType = "default"
     api_spec: Optional[ApiSpec] = None
 
 
@@ -196,6 +209,9 @@ class WebhookConfig:
 
     def __post_init__(self):
         """Validate configuration after initialization."""
+        if not _validate_on_init.get():
+            return
+
         if not self.url.startswith(("http://", "https://")):
             raise ValueError("Webhook URL must start with http:// or https://")
 
@@ -212,6 +228,130 @@ class McpConfig:
     url: str
     headers: Optional[Dict[str, str]] = None
 
+
+def _freeze(value: Any) -> Any:
+    """Convert dicts and lists into hashable tuples for use in an intern key."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _read_only(*_args, **_kwargs):
+    raise TypeError("Interned config values are read-only; build a new config instead")
+
+
+class _ReadOnlyDict(dict):
+    """dict that rejects mutation; still a dict for serializers and ``**`` unpacking."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        # Copies and pickles come back as plain, mutable dicts
+        return dict, (dict(self),)
+
+
+class _ReadOnlyList(list):
+    """list that rejects mutation; still a list for serializers and validators."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+
+def _make_read_only(value: Any) -> Any:
+    """Recursively copy dicts and lists into their read-only counterparts."""
+    if isinstance(value, dict):
+        return _ReadOnlyDict((k, _make_read_only(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return _ReadOnlyList(_make_read_only(v) for v in value)
+    return value
+
+
+def _intern(cls, **kwargs):
+    """Construct a frozen config and return the shared instance for equal values.
+
+    Agents that reference the same provider settings end up holding the same
+    object, so a worker with many loaded configs keeps one copy per distinct
+    provider config instead of one per agent. Dict and list fields (such as
+    ``custom_params``) are copied into read-only containers first, so one agent
+    cannot change a shared config under the others.
+    """
+    instance = cls(**kwargs)
+    for f in fields(cls):
+        value = getattr(instance, f.name)
+        if isinstance(value, (dict, list)):
+            object.__setattr__(instance, f.name, _make_read_only(value))
+    key = (cls, _freeze(tuple(getattr(instance, f.name) for f in fields(cls))))
+    return _interned.setdefault(key, instance)
+
+
+def _construct_expr(cls, namespace: Dict[str, Any], source: str) -> str:
+    """Register ``cls`` in a codegen namespace and return the expression building it."""
+    namespace[cls.__name__] = cls
+    if cls.__dataclass_params__.frozen:
+        return f"_intern({cls.__name__}, **{source})"
+    return f"{cls.__name__}(**{source})"
+
+
+def _fast_from_dict(cls):
+    """Generate ``cls.from_dict`` once, from the dataclass fields.
+
+    Every field becomes a direct ``data[...]`` / ``data.get(...)`` lookup in a
+    straight-line function, and nested config dataclasses (plain, ``Optional``
+    or ``List``) are built with a direct constructor call. The dispatch is
+    decided here at class-creation time, so loading a config pays no per-field
+    branching or type introspection. Frozen nested configs go through
+    ``_intern`` so equal provider configs are shared between agents.
+    """
+    namespace: Dict[str, Any] = {"_intern": _intern}
+    args = []
+
+    for f in fields(cls):
+        if not f.init:
+            continue
+
+        key = repr(f.name)
+        origin = get_origin(f.type)
+        type_args = [arg for arg in get_args(f.type) if arg is not type(None)]
+        nested = type_args[0] if len(type_args) == 1 else None
+
+        if is_dataclass(f.type):
+            expr = _construct_expr(f.type, namespace, f"data[{key}]")
+        elif origin is Union and is_dataclass(nested):
+            build = _construct_expr(nested, namespace, "_v")
+            expr = f"{build} if (_v := data.get({key})) else None"
+        elif origin in (list, List) and is_dataclass(nested):
+            build = _construct_expr(nested, namespace, "item")
+            expr = f"[{build} for item in data.get({key}, ())]"
+        elif f.default is not MISSING:
+            namespace[f"_default_{f.name}"] = f.default
+            expr = f"data.get({key}, _default_{f.name})"
+        elif f.default_factory is not MISSING:
+            namespace[f"_factory_{f.name}"] = f.default_factory
+            expr = f"data[{key}] if {key} in data else _factory_{f.name}()"
+        else:
+            expr = f"data[{key}]"
+
+        args.append(f"        {f.name}={expr},")
+
+    source = "\n".join(["def from_dict(cls, data):", "    return cls(", *args, "    )"])
+    exec(compile(source, f"<{cls.__name__}.from_dict>", "exec"), namespace)
+
+    from_dict = namespace["from_dict"]
+    from_dict.__qualname__ = f"{cls.__name__}.from_dict"
+    from_dict.__doc__ = f"Create {cls.__name__} from dictionary."
+    cls.from_dict = classmethod(from_dict)
+    return cls
+
+
+@_fast_from_dict
 @dataclass
 class AgentConfig:
     """Main configuration for a configurable agent."""
@@ -261,13 +401,16 @@ class AgentConfig:
     max_conversation_duration: Optional[int] = None  # seconds
     silence_timeout: Optional[int] = None
     interruption_handling: bool = True
-    noise_cancellation: str = "BVC"
+    noise_cancellation: NoiseCancellationType = "BVC"
 
     # Agent-specific Data
     metadata: Dict[str, Any] = field(default_factory=dict)
 
     def __post_init__(self):
         """Validate configuration after initialization."""
+        if not _validate_on_init.get():
+            return
+
         if not self.agent_id:
             raise ValueError("agent_id is required")
 
@@ -277,7 +420,7 @@ class AgentConfig:
         if not self.system_instructions:
             logger.warning("No system instructions provided")
 
-        if self.noise_cancellation not in [nc.value for nc in NoiseCancellationType]:
+        if self.noise_cancellation not in NOISE_CANCELLATION_TYPES:
             logger.warning(f"Unknown noise cancellation type: {self.noise_cancellation}")
 
         if self.max_conversation_duration and self.max_conversation_duration < 30:
@@ -292,6 +435,9 @@ class AgentConfig:
         """Convert configuration to dictionary for serialization."""
 
         def convert_value(value):
+            # Frozen sub-configs use slots and have no __dict__
+            if is_dataclass(value):
+                return {f.name: convert_value(getattr(value, f.name)) for f in fields(value)}
             if hasattr(value, "__dict__"):
                 return {k: convert_value(v) for k, v in value.__dict__.items()}
             elif isinstance(value, list):
@@ -304,83 +450,12 @@ class AgentConfig:
         return convert_value(self)
 
     def to_json(self, indent: int = 2) -> str:
-        """Convert configuration to JSON string."""
-        return json.dumps(self.to_dict(), indent=indent)
+        """Convert configuration to JSON string.
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "AgentConfig":
-        """Create AgentConfig from dictionary."""
-        # Parse nested configurations
-        llm_config = LLMConfig(**data["llm_config"])
-
-        tts_config = None
-        if data.get("tts_config"):
-            tts_config = TTSConfig(**data["tts_config"])
-
-        stt_config = None
-        if data.get("stt_config"):
-            stt_config = STTConfig(**data["stt_config"])
-
-        rag_config = None
-        if data.get("rag_config"):
-            rag_config = RAGConfig(**data["rag_config"])
-
-        memory_config = None
-        if data.get("memory_config"):
-            memory_config = MemoryConfig(**data["memory_config"])
-
-        # Parse tools
-        tools = []
-        for tool_data in data.get("tools", []):
-            tools.append(ToolConfig(**tool_data))
-
-        # Parse MCP servers
-        mcp_servers = []
-        for mcp_data in data.get("mcp_servers", []):
-            mcp_servers.append(McpConfig(**mcp_data))
-
-        # Parse webhooks
-        evaluation_webhook = None
-        if data.get("evaluation_webhook"):
-            evaluation_webhook = WebhookConfig(**data["evaluation_webhook"])
-
-        metrics_webhook = None
-        if data.get("metrics_webhook"):
-            metrics_webhook = WebhookConfig(**data["metrics_webhook"])
-
-        completion_webhook = None
-        if data.get("completion_webhook"):
-            completion_webhook = WebhookConfig(**data["completion_webhook"])
-
-        # Create the configuration
-        return cls(
-            agent_id=data["agent_id"],
-            name=data["name"],
-            description=data["description"],
-            llm_config=llm_config,
-            agent_type=data.get("agent_type", "assistant"),
-            version=data.get("version", "1.0"),
-            first_message=data.get("first_message"),
-            greeting_instructions=data.get("greeting_instructions"),
-            system_instructions=data.get("system_instructions", ""),
-            guardrails=data.get("guardrails", ""),
-            initial_context=data.get("initial_context", ""),
-            tts_config=tts_config,
-            stt_config=stt_config,
-            vad_config=data.get("vad_config", {}),
-            turn_detection_config=data.get("turn_detection_config", {}),
-            rag_config=rag_config,
-            memory_config=memory_config,
-            tools=tools,
-            evaluation_webhook=evaluation_webhook,
-            metrics_webhook=metrics_webhook,
-            completion_webhook=completion_webhook,
-            max_conversation_duration=data.get("max_conversation_duration"),
-            silence_timeout=data.get("silence_timeout"),
-            interruption_handling=data.get("interruption_handling", True),
-            noise_cancellation=data.get("noise_cancellation", "BVC"),
-            mcp_servers=mcp_servers,
-        )
+        orjson serializes the dataclass tree directly, so the common indents do
+        not go through to_dict().
+        """
+        return dumps_json(self, indent, self.to_dict)
 
     @classmethod
     def from_json(cls, json_str: str) -> "AgentConfig":
@@ -390,40 +465,37 @@ class AgentConfig:
 
     def validate(self) -> List[str]:
         """Validate the configuration and return list of issues."""
-        issues = []
+        return list(self._iter_issues())
 
+    def is_valid(self) -> bool:
+        """Check if configuration is valid.
+
+        Runs the same checks as validate() but stops at the first failure
+        instead of collecting every issue.
+        """
+        return next(self._iter_issues(), None) is None
+
+    def _iter_issues(self) -> Iterator[str]:
+        """Yield configuration issues in order, shared by validate() and is_valid()."""
         # Check required fields
         if not self.agent_id:
-            issues.append("agent_id is required")
+            yield "agent_id is required"
 
         if not self.name:
-            issues.append("name is required")
+            yield "name is required"
 
         if not self.system_instructions:
-            issues.append("system_instructions is recommended")
+            yield "system_instructions is recommended"
 
         # Validate LLM config
         if not self.llm_config:
-            issues.append("llm_config is required")
-
-        # Check tool dependencies
-        for tool in self.tools:
-            if tool.async_execution and not tool.continue_conversation:
-                issues.append(
-                    f"Tool {tool.name}: async_execution requires continue_conversation=True"
-                )
+            yield "llm_config is required"
 
         # Check webhook configurations
         webhooks = [self.evaluation_webhook, self.metrics_webhook, self.completion_webhook]
         for webhook in webhooks:
             if webhook and webhook.enabled and not webhook.url:
-                issues.append("Enabled webhook missing URL")
-
-        return issues
-
-    def is_valid(self) -> bool:
-        """Check if configuration is valid."""
-        return len(self.validate()) == 0
+                yield "Enabled webhook missing URL"
 
     def get_tool_by_name(self, name: str) -> Optional[ToolConfig]:
         """Get tool configuration by name."""
@@ -10,9 +10,8 @@ import json
 import logging
 from pathlib import Path
 from typing import Dict, Any, Optional, List
-import aiohttp
 from supabase import create_client
-from universalagent.core.config import AgentConfig
+from universalagent.core.config import AgentConfig, skip_validation
 
 logger = logging.getLogger(__name__)
 
@@ -104,7 +103,9 @@ class AgentConfigLoaderFromSupabase:
 
             if response.data and response.data.get('config'):
                 logger.info(f"Loaded configuration for agent_id: {agent_id}")
-                return AgentConfig.from_dict(response.data['config'])
+                # Configs in Supabase are validated by the config builder before they are saved
+                with skip_validation():
+                    return AgentConfig.from_dict(response.data['config'])
             else:
                 logger.warning(f"No configuration found for agent_id: {agent_id}")
                 return None
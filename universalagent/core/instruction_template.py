@@ -6,8 +6,10 @@ system instructions following the ElevenLabs six building blocks methodology.
 """
 
 import datetime
+import functools
 import logging
-from typing import Dict, Any, Optional, List
+import re
+from typing import Callable, Dict, Any, Optional, List
 from pathlib import Path
 import jinja2
 from universalagent.tools.tool_holder import ToolHolder
@@ -30,9 +32,13 @@ class InstructionTemplate:
         if template_dir is None:
             template_dir = Path(__file__).parent / "templates"
 
-        # Set up Jinja environment
+        # Set up Jinja environment. Templates ship with the package, so skip the
+        # per-lookup mtime check and serve compiled templates from the env cache.
         self.env = jinja2.Environment(
-            loader=jinja2.FileSystemLoader(template_dir), trim_blocks=True, lstrip_blocks=True
+            loader=jinja2.FileSystemLoader(template_dir),
+            trim_blocks=True,
+            lstrip_blocks=True,
+            auto_reload=False,
         )
 
         logger.info(f"Initialized InstructionTemplate with template directory: {template_dir}")
@@ -94,15 +100,13 @@ class InstructionTemplate:
             "guardrails": config.guardrails,
             "context": config.initial_context,
             "tools": tools,
-            "memory_enabled": config.memory_config.enabled,
+            "memory_enabled": config.memory_config is not None and config.memory_config.enabled,
             "now": now,
         }
 
-        # Add any additional context items
+        # Add any additional context items; they never override the keys above
         if additional_context:
-            for key, value in additional_context.items():
-                if key not in context:  # Don't override existing keys
-                    context[key] = value
+            return {**additional_context, **context}
 
         return context
 
@@ -150,6 +154,58 @@ If you encounter limitations, acknowledge them transparently and suggest alterna
         return fallback
 
 
+@functools.lru_cache(maxsize=8)
+def _get_instruction_template(template_dir: Optional[str] = None) -> InstructionTemplate:
+    """Return a shared InstructionTemplate for ``template_dir``.
+
+    Building the Jinja environment and compiling the base template happens once
+    per process instead of once per agent session.
+    """
+    return InstructionTemplate(template_dir)
+
+
+# Shared environment for rendering instruction strings with runtime data
+_string_template_env = jinja2.Environment(
+    loader=jinja2.BaseLoader(), trim_blocks=True, lstrip_blocks=True
+)
+
+
+# A bare ``{{ name }}`` placeholder, the only syntax the fast render path handles
+_PLACEHOLDER_PATTERN = re.compile(r"\{\{\s*([A-Za-z_][A-Za-z0-9_]*)\s*\}\}")
+
+# Names Jinja resolves to constants rather than looking up in the render data
+_JINJA_LITERALS = frozenset({"true", "false", "none", "True", "False", "None"})
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_string_template(template_string: str) -> Callable[..., str]:
+    """Compile an instruction string once into a render function.
+
+    Instructions that only interpolate bare names are rendered by splicing values
+    between the literal pieces; anything using statements, comments, filters,
+    expressions, Jinja literals (``true``, ``none``, ...) or globals (``range``,
+    ``dict``, ...) goes through Jinja. Missing names render as an empty string either way.
+    """
+    if "{%" not in template_string and "{#" not in template_string:
+        pieces = _PLACEHOLDER_PATTERN.split(template_string)
+        literals = pieces[::2]
+        names = pieces[1::2]
+        if not any("{{" in literal for literal in literals) and not any(
+            name in _JINJA_LITERALS or name in _string_template_env.globals for name in names
+        ):
+
+            def render(**data: Any) -> str:
+                out = [literals[0]]
+                for name, literal in zip(names, literals[1:]):
+                    out.append(str(data[name]) if name in data else "")
+                    out.append(literal)
+                return "".join(out)
+
+            return render
+
+    return _string_template_env.from_string(template_string).render
+
+
 def generate_system_instructions(
     config: AgentConfig,
     additional_context: Optional[Dict[str, Any]] = None,
@@ -166,7 +222,7 @@ def generate_system_instructions(
     Returns:
         Generated system instructions string
     """
-    template = InstructionTemplate(template_dir)
+    template = _get_instruction_template(template_dir)
     instructions = template.generate_instructions(config, additional_context)
     if runtime_metada:
         return render_instructions_with_data(instructions, runtime_metada)
@@ -192,12 +248,13 @@ def render_instructions_with_data(template_string: str, agent_data: Dict[str, An
         result = render_instructions_with_data(template, agent_data)
         # Returns: "You are calling for Acme Corp about customer satisfaction."
     """
-    try:
-        # Create a simple Jinja environment for string templates
-        env = jinja2.Environment(loader=jinja2.BaseLoader(), trim_blocks=True, lstrip_blocks=True)
+    # Plain instructions have nothing to render
+    if "{{" not in template_string and "{%" not in template_string and "{#" not in template_string:
+        return template_string.strip()
 
-        template = env.from_string(template_string)
-        return template.render(**agent_data).strip()
+    try:
+        render = _compile_string_template(template_string)
+        return render(**agent_data).strip()
 
     except Exception as e:
         logger.warning(f"Failed to render template string with agent data: {e}")
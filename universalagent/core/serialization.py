@@ -0,0 +1,35 @@
+"""
+JSON encoding shared by configuration and transcript models.
+"""
+
+import json
+from typing import Any, Callable, Optional
+
+import orjson
+
+
+def dumps_json(
+    obj: Any, indent: Optional[int] = 2, to_plain: Optional[Callable[[], Any]] = None
+) -> str:
+    """Encode ``obj`` as a JSON string.
+
+    orjson handles compact output and two-space indentation. orjson has no other
+    indent widths, so those go through the standard library encoder, which needs
+    plain dicts and lists: ``to_plain`` supplies them when ``obj`` is a dataclass.
+
+    Unlike ``json.dumps`` defaults, the orjson output is compact (no spaces after
+    separators) and writes non-ASCII characters as UTF-8 instead of ``\\u`` escapes.
+
+    Args:
+        obj: Value to encode; dataclasses and datetimes are handled natively by orjson
+        indent: None for compact output, otherwise the indentation width
+        to_plain: Builds a standard-library-serializable version of ``obj``
+
+    Returns:
+        JSON string
+    """
+    if indent not in (None, 2):
+        return json.dumps(to_plain() if to_plain else obj, indent=indent)
+
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+    return orjson.dumps(obj, option=option).decode()
@@ -17,10 +17,35 @@ from universalagent.transcripts.models import (
     TranscriptWebhookPayload,
 )
 
-from universalagent.events.webhook_client import WebhookClient
+from universalagent.events.webhook_client import BatchingWebhookClient, WebhookClient
 
 logger = logging.getLogger(__name__)
 
+# UsageSummary fields forwarded in the metrics webhook payload
+_METRICS_KEYS = (
+    "llm_prompt_tokens",
+    "llm_prompt_cached_tokens",
+    "llm_completion_tokens",
+    "tts_characters_count",
+    "stt_audio_duration",
+)
+
+
+def _build_messages(items) -> List[TranscriptMessage]:
+    # LiveKit ChatMessage content is a list of text parts
+    return [
+        TranscriptMessage(
+            item.role,
+            " ".join(c) if type(c := item.content) is list else str(c),
+            item.interrupted,
+        )
+        for item in items
+    ]
+
+
+def _build_metrics(usage: UsageSummary) -> Dict[str, Any]:
+    return {key: getattr(usage, key) for key in _METRICS_KEYS}
+
 
 class EventSender:
     """Sends transcript and metrics events to webhook endpoints."""
@@ -29,23 +54,51 @@ class EventSender:
         self,
         transcript_webhook_url: Optional[str] = None,
         metrics_webhook_url: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        flush_interval_ms: int = 500,
     ):
         """Initialize event sender.
 
         Args:
             transcript_webhook_url: URL for transcript webhooks
             metrics_webhook_url: URL for metrics webhooks
+            batch_size: If set, coalesce up to this many events per POST
+                (sent as ``{"batch_id": ..., "events": [...]}``)
+            flush_interval_ms: Maximum time an event waits for its batch to fill
         """
         self.transcript_client = None
         if transcript_webhook_url:
-            self.transcript_client = WebhookClient(transcript_webhook_url)
+            self.transcript_client = self._create_client(
+                transcript_webhook_url, batch_size, flush_interval_ms
+            )
 
         self.metrics_client = None
         if metrics_webhook_url:
-            self.metrics_client = WebhookClient(metrics_webhook_url)
+            self.metrics_client = self._create_client(
+                metrics_webhook_url, batch_size, flush_interval_ms
+            )
 
         self.transcript_formatter = MarkdownFormatter().format
 
+        # Unconfigured webhooks resolve straight to a no-op, logged once here
+        if self.transcript_client is None:
+            logger.info("No transcript webhook configured")
+            self.send_transcript = self._noop_send
+        if self.metrics_client is None:
+            logger.info("No metrics webhook configured")
+            self.send_metrics = self._noop_send
+
+    @staticmethod
+    def _create_client(url: str, batch_size: Optional[int], flush_interval_ms: int):
+        client = WebhookClient(url)
+        if batch_size:
+            return BatchingWebhookClient(client, batch_size, flush_interval_ms)
+        return client
+
+    @staticmethod
+    async def _noop_send(*args, **kwargs) -> bool:
+        return False
+
     async def send_transcript(
         self, session: AgentSession, transcript_metadata: TranscriptMetadata
     ) -> bool:
@@ -59,23 +112,11 @@ class EventSender:
             True if successful, False otherwise
         """
         if not self.transcript_client:
-            logger.info("No transcript webhook configured")
             return False
 
         try:
             # Get transcript history from session
-            transcript_messages: List[TranscriptMessage] = [
-                TranscriptMessage(
-                    role=item.role,
-                    content=(
-                        " ".join(item.content)
-                        if isinstance(item.content, list)
-                        else str(item.content)
-                    ),
-                    interrupted=item.interrupted,
-                )
-                for item in session.history.items
-            ]
+            transcript_messages = _build_messages(session.history.items)
 
             transcript: Transcript = Transcript(
                 metadata=transcript_metadata,
@@ -108,22 +149,15 @@ class EventSender:
             True if successful, False otherwise
         """
         if not self.metrics_client:
-            logger.info("No metrics webhook configured")
             return False
 
         try:
             # Create payload with metadata and metrics
             payload = {
                 "event_type": "metrics",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": datetime.now(),
                 "metadata": metadata,
-                "metrics": {
-                    "llm_prompt_tokens": usage.llm_prompt_tokens,
-                    "llm_prompt_cached_tokens": usage.llm_prompt_cached_tokens,
-                    "llm_completion_tokens": usage.llm_completion_tokens,
-                    "tts_characters_count": usage.tts_characters_count,
-                    "stt_audio_duration": usage.stt_audio_duration,
-                },
+                "metrics": _build_metrics(usage),
             }
 
             # Send to webhook
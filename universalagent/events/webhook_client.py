@@ -3,27 +3,95 @@
 Simple webhook client for sending events.
 """
 
+import asyncio
 import logging
+import random
+import time
+import uuid
+from collections import deque
 import aiohttp
-from typing import Dict, Any, Optional
+import orjson
+from typing import Dict, Any, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Statuses worth retrying; anything else is treated as a permanent rejection
+_RETRY_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+# Queue marker telling the batch flusher to send what it has and stop
+_CLOSE = object()
+
+# Process-wide keep-alive session shared by WebhookClients that are not given one.
+# Its connector limit also caps concurrent webhook requests across all sessions
+# in the process.
+_shared_session: Optional[aiohttp.ClientSession] = None
+_shared_refs = 0
+
+
+def _acquire_shared_session() -> aiohttp.ClientSession:
+    global _shared_session, _shared_refs
+    if _shared_session is None or _shared_session.closed:
+        connector = aiohttp.TCPConnector(limit=32, keepalive_timeout=30)
+        _shared_session = aiohttp.ClientSession(connector=connector)
+        _shared_refs = 0
+    _shared_refs += 1
+    return _shared_session
+
+
+async def _release_shared_session(session: aiohttp.ClientSession) -> None:
+    global _shared_session, _shared_refs
+    if session is not _shared_session:
+        return
+    _shared_refs -= 1
+    if _shared_refs <= 0:
+        _shared_session = None
+        await session.close()
+
 
 class WebhookClient:
     """Simple client for sending data to webhook endpoints."""
 
-    def __init__(self, webhook_url: str, headers: Optional[Dict[str, str]] = None):
+    def __init__(
+        self,
+        webhook_url: str,
+        headers: Optional[Dict[str, str]] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        failure_threshold: int = 5,
+        cooldown_seconds: float = 30.0,
+        timeout: float = 30.0,
+        connect_timeout: Optional[float] = 5.0,
+    ):
         """Initialize webhook client.
 
         Args:
             webhook_url: URL to send data to
             headers: Optional HTTP headers
+            session: Optional ClientSession, closed by the caller; defaults to a
+                process-wide keep-alive session released in aclose()
+            max_retries: Number of retries after the first attempt on transient failures
+            backoff_base: Initial retry delay in seconds, doubled on each retry
+            failure_threshold: Consecutive failed sends before the circuit opens
+            cooldown_seconds: How long an open circuit fails sends without trying
+            timeout: Total seconds allowed for one request attempt
+            connect_timeout: Seconds allowed to acquire a connection, so an unreachable
+                endpoint fails fast instead of using the whole timeout
         """
         self.webhook_url = webhook_url
-        self.headers = headers or {"Content-Type": "application/json"}
-        connector = aiohttp.TCPConnector(force_close=True)
-        self._session = aiohttp.ClientSession(connector=connector)
+        # Payloads are sent as pre-encoded bytes, so the JSON content type must be explicit
+        self.headers = {"Content-Type": "application/json", **(headers or {})}
+        self._uses_shared_session = session is None
+        self._session = session if session is not None else _acquire_shared_session()
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.timeout = aiohttp.ClientTimeout(total=timeout, connect=connect_timeout)
+        # Payloads that could not be delivered, kept for inspection or retry_failed()
+        self.failed_payloads: deque = deque(maxlen=1000)
+        self._failures = 0
+        self._open_until = 0.0
 
     async def send_payload(self, payload: Dict[str, Any]) -> bool:
         """Send payload to webhook.
@@ -34,26 +102,170 @@ class WebhookClient:
         Returns:
             True if successful, False otherwise
         """
+        if time.monotonic() < self._open_until:
+            self.failed_payloads.append(payload)
+            return False
+
         try:
-            async with self._session.post(
-                self.webhook_url,
-                headers=self.headers,
-                json=payload,
-                timeout=aiohttp.ClientTimeout(total=30),
-            ) as response:
-                if response.status == 200:
-                    logger.info(f"Successfully sent data to webhook")
-                    return True
-                else:
+            data = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError as e:
+            logger.error(f"Error serializing webhook payload: {e}")
+            return False
+
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                delay = self.backoff_base * 2 ** (attempt - 1)
+                await asyncio.sleep(delay + random.uniform(0, delay / 2))
+            try:
+                async with self._session.post(
+                    self.webhook_url,
+                    headers=self.headers,
+                    data=data,
+                    timeout=self.timeout,
+                ) as response:
+                    if response.status == 200:
+                        logger.info(f"Successfully sent data to webhook")
+                        self._failures = 0
+                        return True
                     logger.error(
                         f"Failed to send data. Status: {response.status}, Response: {await response.text()}"
                     )
-                    return False
-        except Exception as e:
-            logger.error(f"Error sending data to webhook: {e}")
-            return False
+                    if response.status not in _RETRY_STATUSES:
+                        break
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning(f"Error sending data to webhook (attempt {attempt + 1}): {e}")
+            except Exception as e:
+                logger.error(f"Error sending data to webhook: {e}")
+                break
+
+        self.failed_payloads.append(payload)
+        self._failures += 1
+        if self._failures >= self.failure_threshold:
+            self._open_until = time.monotonic() + self.cooldown_seconds
+            logger.warning(
+                f"Webhook failed {self._failures} times in a row, pausing sends for {self.cooldown_seconds}s"
+            )
+        return False
+
+    async def retry_failed(self) -> int:
+        """Resend buffered failed payloads.
+
+        Returns:
+            Number of payloads delivered
+        """
+        delivered = 0
+        for _ in range(len(self.failed_payloads)):
+            if time.monotonic() < self._open_until:
+                break
+            if await self.send_payload(self.failed_payloads.popleft()):
+                delivered += 1
+        return delivered
 
     async def aclose(self) -> None:
-        """Close the underlying ClientSession."""
-        if not self._session.closed:
-            await self._session.close()
+        """Release the process-wide session; a caller-provided session is left open."""
+        if self._uses_shared_session:
+            self._uses_shared_session = False
+            await _release_shared_session(self._session)
+
+
+class BatchingWebhookClient:
+    """Webhook client that coalesces payloads into batched POSTs.
+
+    Payloads are queued and sent by a background task as a single
+    ``{"batch_id": ..., "events": [...]}`` body once ``batch_size`` payloads are
+    waiting or ``flush_interval_ms`` has passed since the first one arrived.
+    """
+
+    def __init__(self, client: WebhookClient, batch_size: int = 10, flush_interval_ms: int = 500):
+        """Initialize batching webhook client.
+
+        Args:
+            client: Client used to POST each batch
+            batch_size: Maximum number of payloads per batch
+            flush_interval_ms: Maximum time a payload waits for a batch to fill
+        """
+        self._client = client
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._flusher: Optional[asyncio.Task] = None
+
+    async def send_payload(self, payload: Dict[str, Any]) -> bool:
+        """Queue payload for the next batch.
+
+        Args:
+            payload: Data to send
+
+        Returns:
+            True once the payload is queued
+        """
+        self._queue.put_nowait(payload)
+        self._ensure_flusher()
+        return True
+
+    def _ensure_flusher(self) -> None:
+        # Restart the flusher if it was never started or has died, so queued
+        # payloads are never stranded
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        """Drain the queue into batches until aclose() is called.
+
+        Besides payloads the queue carries two markers: ``_CLOSE`` and futures
+        queued by flush(), which are resolved once everything ahead of them is sent.
+        """
+        loop = asyncio.get_running_loop()
+
+        while True:
+            item = await self._queue.get()
+            batch: List[Dict[str, Any]] = []
+            marker = None
+
+            if item is _CLOSE or isinstance(item, asyncio.Future):
+                marker = item
+            else:
+                batch.append(item)
+                deadline = loop.time() + self.flush_interval
+                while len(batch) < self.batch_size:
+                    try:
+                        item = await asyncio.wait_for(self._queue.get(), deadline - loop.time())
+                    except asyncio.TimeoutError:
+                        break
+                    if item is _CLOSE or isinstance(item, asyncio.Future):
+                        marker = item
+                        break
+                    batch.append(item)
+
+            if batch:
+                try:
+                    await self._client.send_payload({"batch_id": uuid.uuid4().hex, "events": batch})
+                except Exception as e:
+                    logger.error(f"Error sending webhook batch of {len(batch)} events: {e}")
+            if marker is _CLOSE:
+                return
+            if marker is not None and not marker.done():
+                marker.set_result(None)
+
+    async def flush(self) -> None:
+        """Send all queued payloads now instead of waiting for the batch to fill."""
+        if self._flusher is None:
+            return
+        self._ensure_flusher()
+        flushed = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait(flushed)
+        await flushed
+
+    async def aclose(self) -> None:
+        """Send queued payloads, stop the flusher and close the underlying client."""
+        try:
+            if self._flusher is not None:
+                self._ensure_flusher()
+                self._queue.put_nowait(_CLOSE)
+                await self._flusher
+        finally:
+            # Also reached when the drain is cancelled, e.g. by a shutdown timeout
+            if self._flusher is not None and not self._flusher.done():
+                self._flusher.cancel()
+            self._flusher = None
+            await self._client.aclose()
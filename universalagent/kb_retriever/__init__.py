@@ -1,5 +1,6 @@
 """KB Retriever package for semantic document retrieval."""
 
+from .embedding_batcher import EmbeddingBatcher
 from .interfaces.retrieval import IRetrievalPipeline
 from .llamaindex_document_retrieval import LlamaIndexDocumentRetrievalFromPinecone
 from .models.retrieval import (
@@ -19,6 +20,7 @@ __all__ = [
     
     # Concrete implementation
     "LlamaIndexDocumentRetrievalFromPinecone",
+    "EmbeddingBatcher",
     
     # Data models
     "QueryRequest",
@@ -0,0 +1,92 @@
+"""Micro-batching of embedding requests."""
+
+import asyncio
+from typing import Awaitable, Callable, List, Optional, Set, Tuple
+
+EmbedBatchFn = Callable[[List[str]], Awaitable[List[List[float]]]]
+
+
+class EmbeddingBatcher:
+    """Coalesces concurrent embedding requests into batched provider calls.
+
+    Each call to embed() queues its text and waits on a future. Queued texts are
+    sent in one provider call once ``max_batch_size`` are waiting, or after
+    ``max_wait_ms``. With the default wait of 0 the flush happens on the next event
+    loop iteration, so only requests that are already concurrent get batched and a
+    lone query pays no extra latency.
+    """
+
+    def __init__(
+        self,
+        embed_batch: EmbedBatchFn,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 0,
+    ):
+        """Initialize the batcher.
+
+        Args:
+            embed_batch: Coroutine function embedding a list of texts in one call
+            max_batch_size: Maximum number of texts per provider call
+            max_wait_ms: How long the first queued text waits for others to join
+        """
+        self._embed_batch = embed_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._timer: Optional[asyncio.Task] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def embed(self, text: str) -> List[float]:
+        """Embed a single text as part of the next batch.
+
+        Args:
+            text: The text to embed
+
+        Returns:
+            Embedding vector for the text
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((text, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._spawn(self._run(self._take_batch()))
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_after_wait())
+
+        return await future
+
+    def _take_batch(self) -> List[Tuple[str, asyncio.Future]]:
+        batch = self._pending[: self.max_batch_size]
+        self._pending = self._pending[self.max_batch_size :]
+        return batch
+
+    def _spawn(self, coro: Awaitable[None]) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _flush_after_wait(self) -> None:
+        await asyncio.sleep(self.max_wait)
+        self._timer = None
+        while self._pending:
+            self._spawn(self._run(self._take_batch()))
+
+    async def _run(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        try:
+            vectors = await self._embed_batch([text for text, _ in batch])
+            if len(vectors) != len(batch):
+                raise ValueError(
+                    f"Embedding provider returned {len(vectors)} vectors for {len(batch)} texts"
+                )
+            for (_, future), vector in zip(batch, vectors):
+                if not future.done():
+                    future.set_result(vector)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            # Cancellation or another BaseException must not leave waiters pending
+            for _, future in batch:
+                if not future.done():
+                    future.cancel()
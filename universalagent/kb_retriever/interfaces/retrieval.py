@@ -1,7 +1,8 @@
 """Interface for retrieval pipelines."""
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Protocol
+from typing import List, Protocol
 
 from kb_retriever.models.retrieval import QueryRequest, RetrievalResult
 
@@ -14,17 +15,38 @@ class IRetrievalPipeline(ABC):
     """
     
     @abstractmethod
-    async def retrieve(self, request: QueryRequest) -> RetrievalResult:
+    async def retrieve(
+        self, request: QueryRequest, include_metadata: bool = True
+    ) -> RetrievalResult:
         """Retrieve relevant nodes for the given query.
         
         Args:
             request: The query request with search parameters
+            include_metadata: Whether to echo the request parameters in query_metadata
             
         Returns:
             RetrievalResult containing retrieved nodes and metadata
         """
         pass
     
+    async def retrieve_batch(
+        self, requests: List[QueryRequest], include_metadata: bool = True
+    ) -> List[RetrievalResult]:
+        """Retrieve relevant nodes for several queries concurrently.
+        
+        Implementations can override this to share work across queries.
+        
+        Args:
+            requests: The query requests to run
+            include_metadata: Whether to echo the request parameters in query_metadata
+            
+        Returns:
+            One RetrievalResult per request, in the same order
+        """
+        return await asyncio.gather(
+            *(self.retrieve(request, include_metadata) for request in requests)
+        )
+    
     @abstractmethod
     async def validate_query(self, request: QueryRequest) -> bool:
         """Validate if the query request can be processed.
@@ -1,9 +1,13 @@
 """LlamaIndex-based document retrieval from Pinecone vector store."""
 
 import asyncio
+import hashlib
+import logging
 import os
 import time
-from typing import List, Optional
+import weakref
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 
 from llama_index.core import VectorStoreIndex
 from llama_index.core.vector_stores import (
@@ -12,14 +16,16 @@ from llama_index.core.vector_stores import (
     FilterOperator,
 )
 from llama_index.core.retrievers import VectorIndexRetriever
-from llama_index.core.schema import NodeWithScore
+from llama_index.core.schema import NodeWithScore, QueryBundle
 from llama_index.core.vector_stores import VectorStoreQuery
 from llama_index.embeddings.openai import OpenAIEmbedding
 from llama_index.vector_stores.pinecone import PineconeVectorStore
 from pinecone import Pinecone
 
+from kb_retriever.embedding_batcher import EmbeddingBatcher
 from kb_retriever.interfaces.retrieval import IRetrievalPipeline
 from kb_retriever.models.retrieval import (
+    QUERY_MODES,
     EmbeddingConfig,
     QueryRequest,
     RetrievalResult,
@@ -27,6 +33,54 @@ from kb_retriever.models.retrieval import (
     RetrievalConfig,
 )
 
+logger = logging.getLogger(__name__)
+
+_RETRIEVER_CACHE_SIZE = 32
+
+# Query embeddings from all pipelines in the process using the same key and model
+# go through one batcher, so concurrent sessions share provider calls. Entries are
+# weak so a batcher goes away with the last pipeline holding it.
+_embedding_batchers: "weakref.WeakValueDictionary[Tuple[str, str, int], EmbeddingBatcher]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _query_embedding_batch_fn(embedding_model: OpenAIEmbedding):
+    """Build the batch function embedding texts as queries with ``embedding_model``."""
+    # Current OpenAI models embed queries and documents with the same engine, so one
+    # text batch call returns what aget_query_embedding would for each query
+    if getattr(embedding_model, "_query_engine", None) == getattr(
+        embedding_model, "_text_engine", None
+    ):
+        return embedding_model.aget_text_embedding_batch
+
+    async def embed_queries(queries: List[str]) -> List[List[float]]:
+        return await asyncio.gather(
+            *(embedding_model.aget_query_embedding(query) for query in queries)
+        )
+
+    return embed_queries
+
+
+def _get_embedding_batcher(
+    embedding_config: EmbeddingConfig, embedding_model: OpenAIEmbedding
+) -> EmbeddingBatcher:
+    # The key covers every setting the model and batcher are built from, so a
+    # pipeline only ever shares another pipeline's model when they are identical
+    key = (
+        hashlib.sha256(embedding_config.api_key.encode()).hexdigest(),
+        embedding_config.model_name,
+        embedding_config.batch_size,
+    )
+    batcher = _embedding_batchers.get(key)
+    if batcher is None:
+        batcher = EmbeddingBatcher(
+            _query_embedding_batch_fn(embedding_model),
+            max_batch_size=embedding_config.batch_size,
+        )
+        _embedding_batchers[key] = batcher
+    return batcher
+
 
 class LlamaIndexDocumentRetrievalFromPinecone(IRetrievalPipeline):
     """LlamaIndex-based document retrieval using Pinecone vector store.
@@ -57,17 +111,73 @@ class LlamaIndexDocumentRetrievalFromPinecone(IRetrievalPipeline):
             vector_store=self.vector_store,
             embed_model=self.embedding_model,
         )
+
+        self._embedding_batcher = _get_embedding_batcher(config.embedding_config, self.embedding_model)
+        
+        # Per-pipeline LRU of whitespace-normalized query text -> embedding, so repeated
+        # questions skip the embedding call
+        self._embedding_cache: "OrderedDict[str, List[float]]" = OrderedDict()
+        # Retrievers keyed on (similarity_top_k, query_mode, knowledge_base_ids)
+        self._retriever_cache: "OrderedDict[tuple, VectorIndexRetriever]" = OrderedDict()
     
-    async def retrieve(self, request: QueryRequest) -> RetrievalResult:
+    async def retrieve(
+        self, request: QueryRequest, include_metadata: bool = True
+    ) -> RetrievalResult:
         """Retrieve relevant nodes for the given query.
         
         Args:
             request: The query request with search parameters
+            include_metadata: Whether to echo the request parameters in query_metadata
             
         Returns:
             RetrievalResult containing retrieved nodes and metadata
         """
-        start_time = time.time()
+        return await self._retrieve(request, include_metadata=include_metadata)
+    
+    async def retrieve_batch(
+        self, requests: List[QueryRequest], include_metadata: bool = True
+    ) -> List[RetrievalResult]:
+        """Retrieve nodes for several queries concurrently.
+        
+        Embeddings for all valid queries go through the same cache and batcher as
+        retrieve(), so uncached ones share a provider call, before the vector store
+        queries run in parallel.
+        
+        Args:
+            requests: The query requests to run
+            include_metadata: Whether to echo the request parameters in query_metadata
+            
+        Returns:
+            One RetrievalResult per request, in the same order
+        """
+        valid_queries = [
+            request.query for request in requests if await self.validate_query(request)
+        ]
+        embeddings = {}
+        if valid_queries:
+            try:
+                embeddings = await self._get_query_embeddings(valid_queries)
+            except Exception:
+                # Fall back to per-request embedding so each result carries its own error
+                embeddings = {}
+        
+        return await asyncio.gather(
+            *(
+                self._retrieve(
+                    request, embeddings.get(self._cache_key(request.query)), include_metadata
+                )
+                for request in requests
+            )
+        )
+    
+    async def _retrieve(
+        self,
+        request: QueryRequest,
+        embedding: Optional[List[float]] = None,
+        include_metadata: bool = True,
+    ) -> RetrievalResult:
+        """Run a single retrieval, optionally with a precomputed query embedding."""
+        start_ns = time.perf_counter_ns()
         
         try:
             # Validate query first
@@ -75,30 +185,17 @@ class LlamaIndexDocumentRetrievalFromPinecone(IRetrievalPipeline):
                 return RetrievalResult(
                     success=False,
                     error=ValueError("Invalid query request"),
-                    processing_time_seconds=time.time() - start_time,
-                )
-            
-            filters = None
-            if request.knowledge_base_ids:
-                filters = MetadataFilters(
-                    filters=[
-                        MetadataFilter(
-                            key="kb_key", operator=FilterOperator.IN, value=request.knowledge_base_ids
-                        )
-                    ]
+                    processing_time_seconds=(time.perf_counter_ns() - start_ns) / 1e9,
                 )
             
-            print(f"Filters: {filters}")
-            # Configure retriever with request parameters
-            retriever = VectorIndexRetriever(
-                index=self.vector_index,
-                similarity_top_k=request.similarity_top_k,
-                vector_store_query_mode=request.query_mode,
-                filters=filters,
-            )
+            retriever = self._get_retriever(request)
 
             # Perform retrieval
-            nodes_with_scores = await retriever.aretrieve(request.query)
+            if embedding is None:
+                embedding = await self.get_query_embedding(request.query)
+            nodes_with_scores = await retriever.aretrieve(
+                QueryBundle(query_str=request.query, embedding=embedding)
+            )
             
             # Apply similarity filtering if specified
             filtered_nodes = self._apply_similarity_filter(
@@ -108,7 +205,7 @@ class LlamaIndexDocumentRetrievalFromPinecone(IRetrievalPipeline):
             # Convert to our RetrievedNode format
             retrieved_nodes = self._convert_nodes_to_retrieved_nodes(filtered_nodes)
             
-            processing_time = time.time() - start_time
+            processing_time = (time.perf_counter_ns() - start_ns) / 1e9
             
             return RetrievalResult(
                 success=True,
@@ -119,13 +216,13 @@ class LlamaIndexDocumentRetrievalFromPinecone(IRetrievalPipeline):
                     "query_mode": request.query_mode,
                     "similarity_threshold": request.similarity_threshold,
                     "namespace": request.namespace,
-                },
+                } if include_metadata else {},
                 total_nodes_found=len(retrieved_nodes),
                 processing_time_seconds=processing_time,
             )
             
         except Exception as e:
-            processing_time = time.time() - start_time
+            processing_time = (time.perf_counter_ns() - start_ns) / 1e9
             return RetrievalResult(
                 success=False,
                 error=e,
@@ -133,10 +230,95 @@ class LlamaIndexDocumentRetrievalFromPinecone(IRetrievalPipeline):
                     "original_query": request.query,
                     "similarity_top_k": request.similarity_top_k,
                     "query_mode": request.query_mode,
-                },
+                } if include_metadata else {},
                 processing_time_seconds=processing_time,
             )
     
+    def _get_retriever(self, request: QueryRequest) -> VectorIndexRetriever:
+        """Get a retriever configured for the request, reusing one built for the same parameters.
+        
+        Args:
+            request: The query request with search parameters
+            
+        Returns:
+            VectorIndexRetriever for the request's top-k, query mode and knowledge bases
+        """
+        kb_ids = request.knowledge_base_ids
+        key = (request.similarity_top_k, request.query_mode, tuple(kb_ids) if kb_ids else None)
+        retriever = self._retriever_cache.get(key)
+        if retriever is not None:
+            self._retriever_cache.move_to_end(key)
+            return retriever
+        
+        filters = None
+        if kb_ids:
+            filters = MetadataFilters(
+                filters=[
+                    MetadataFilter(
+                        key="kb_key", operator=FilterOperator.IN, value=kb_ids
+                    )
+                ]
+            )
+        
+        logger.debug("Filters: %s", filters)
+        # Configure retriever with request parameters
+        retriever = VectorIndexRetriever(
+            index=self.vector_index,
+            similarity_top_k=request.similarity_top_k,
+            vector_store_query_mode=request.query_mode,
+            filters=filters,
+        )
+        self._retriever_cache[key] = retriever
+        if len(self._retriever_cache) > _RETRIEVER_CACHE_SIZE:
+            self._retriever_cache.popitem(last=False)
+        return retriever
+    
+    @staticmethod
+    def _cache_key(query: str) -> str:
+        # Only whitespace is normalized: case can change the embedding
+        return " ".join(query.split())
+    
+    def _cache_embedding(self, key: str, embedding: List[float]) -> None:
+        if self.config.embedding_cache_size > 0:
+            self._embedding_cache[key] = embedding
+            if len(self._embedding_cache) > self.config.embedding_cache_size:
+                self._embedding_cache.popitem(last=False)
+    
+    async def get_query_embedding(self, query: str) -> List[float]:
+        """Get the embedding for a query, reusing cached vectors for repeated queries.
+        
+        Args:
+            query: The query text
+            
+        Returns:
+            Query embedding vector
+        """
+        key = self._cache_key(query)
+        embedding = self._embedding_cache.get(key)
+        if embedding is not None:
+            self._embedding_cache.move_to_end(key)
+            return embedding
+        
+        embedding = await self._embedding_batcher.embed(query)
+        self._cache_embedding(key, embedding)
+        return embedding
+    
+    async def _get_query_embeddings(self, queries: List[str]) -> Dict[str, List[float]]:
+        """Get embeddings for several queries through get_query_embedding.
+        
+        Uncached queries are embedded concurrently, so the embedding batcher sends
+        them together in one provider call.
+        
+        Args:
+            queries: The query texts
+            
+        Returns:
+            Mapping of cache key to embedding vector
+        """
+        unique = {self._cache_key(query): query for query in queries}
+        vectors = await asyncio.gather(*(self.get_query_embedding(query) for query in unique.values()))
+        return dict(zip(unique, vectors))
+    
     async def validate_query(self, request: QueryRequest) -> bool:
         """Validate if the query request can be processed.
         
@@ -146,28 +328,18 @@ class LlamaIndexDocumentRetrievalFromPinecone(IRetrievalPipeline):
         Returns:
             True if the query is valid and can be processed, False otherwise
         """
-        try:
-            # Check if query is not empty
-            if not request.query or not request.query.strip():
-                return False
-            
-            # Check if similarity_top_k is reasonable
-            if request.similarity_top_k <= 0 or request.similarity_top_k > 1000:
-                return False
-            
-            # Check similarity threshold if provided
-            if request.similarity_threshold is not None:
-                if not (0.0 <= request.similarity_threshold <= 1.0):
-                    return False
-            
-            # Check query mode
-            if request.query_mode not in ["default", "sparse", "hybrid"]:
-                return False
-            
-            return True
-            
-        except Exception:
+        query = request.query
+        if not query or query.isspace():
+            return False
+        
+        if not (0 < request.similarity_top_k <= 1000):
             return False
+        
+        threshold = request.similarity_threshold
+        if threshold is not None and not (0.0 <= threshold <= 1.0):
+            return False
+        
+        return request.query_mode in QUERY_MODES
     
     def _apply_similarity_filter(
         self, 
@@ -186,13 +358,11 @@ class LlamaIndexDocumentRetrievalFromPinecone(IRetrievalPipeline):
         if threshold is None:
             return nodes_with_scores
         
-        filtered_nodes = []
-        for node_with_score in nodes_with_scores:
-            score = node_with_score.score
-            if score is not None and score >= threshold:
-                filtered_nodes.append(node_with_score)
-        
-        return filtered_nodes
+        return [
+            node_with_score
+            for node_with_score in nodes_with_scores
+            if node_with_score.score is not None and node_with_score.score >= threshold
+        ]
     
     def _convert_nodes_to_retrieved_nodes(
         self, nodes_with_scores: List[NodeWithScore]
@@ -205,27 +375,16 @@ class LlamaIndexDocumentRetrievalFromPinecone(IRetrievalPipeline):
         Returns:
             List of RetrievedNode objects with our abstraction
         """
-        retrieved_nodes = []
-        
-        for node_with_score in nodes_with_scores:
-            node = node_with_score.node
-            score = node_with_score.score or 0.0
-            
-            # Extract content and metadata
-            content = node.get_content()
-            metadata = dict(node.metadata) if node.metadata else {}
-            
-            # Create our RetrievedNode
-            retrieved_node = RetrievedChunk(
-                node_id=node.node_id,
-                content=content,
-                similarity_score=score,
-                metadata=metadata,
+        return [
+            RetrievedChunk(
+                node_id=(node := node_with_score.node).node_id,
+                content=node.get_content(),
+                similarity_score=node_with_score.score or 0.0,
+                # Shared with the node rather than copied; chunks treat metadata as read-only
+                metadata=node.metadata or {},
             )
-            
-            retrieved_nodes.append(retrieved_node)
-        
-        return retrieved_nodes
+            for node_with_score in nodes_with_scores
+        ]
 
 
 if __name__ == "__main__":
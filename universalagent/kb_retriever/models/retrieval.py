@@ -1,12 +1,13 @@
 """Data models for retrieval operations."""
 
-import time
+import heapq
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
-from uuid import uuid4
 
+QUERY_MODES = frozenset(("default", "sparse", "hybrid"))
 
-@dataclass
+
+@dataclass(slots=True)
 class QueryRequest:
     """Request object for retrieval operations."""
     
@@ -26,14 +27,14 @@ class QueryRequest:
         if self.similarity_top_k <= 0:
             raise ValueError("similarity_top_k must be positive")
         
-        if self.similarity_threshold is not None and not (0.0 <= self.similarity_threshold <= 1.0):
+        if (threshold := self.similarity_threshold) is not None and (threshold < 0.0 or threshold > 1.0):
             raise ValueError("similarity_threshold must be between 0.0 and 1.0")
         
-        if self.query_mode not in ["default", "sparse", "hybrid"]:
+        if self.query_mode not in QUERY_MODES:
             raise ValueError("query_mode must be 'default', 'sparse', or 'hybrid'")
 
 
-@dataclass
+@dataclass(slots=True)
 class RetrievedChunk:
     """A single retrieved node with content and metadata."""
     
@@ -41,25 +42,29 @@ class RetrievedChunk:
     content: str
     similarity_score: float
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _source_ref: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     def get_citation_info(self) -> Dict[str, Any]:
         """Get citation-friendly information from this node."""
+        preview = self.content[:200]
         return {
             "node_id": self.node_id,
             "source_file": self.metadata.get("file_name", "Unknown"),
             "similarity_score": self.similarity_score,
-            "content_preview": self.content[:200] + "..." if len(self.content) > 200 else self.content,
+            "content_preview": preview + "..." if len(self.content) > 200 else preview,
             "metadata": self.metadata,
         }
     
     def get_source_reference(self) -> str:
         """Get a human-readable source reference for citations."""
+        if self._source_ref is not None:
+            return self._source_ref
+        
         source_file = self.metadata.get("file_name", "Unknown Source")
         page_num = self.metadata.get("page_number")
         
-        if page_num:
-            return f"{source_file} (Page {page_num})"
-        return source_file
+        self._source_ref = f"{source_file} (Page {page_num})" if page_num else source_file
+        return self._source_ref
     
     def get_content_with_metadata(self) -> str:
         """Get content with relevant metadata context."""
@@ -67,7 +72,7 @@ class RetrievedChunk:
         return f"[Source: {source_ref}]\n{self.content}"
 
 
-@dataclass
+@dataclass(slots=True)
 class RetrievalResult:
     """Result of a retrieval operation."""
     
@@ -85,7 +90,10 @@ class RetrievalResult:
     
     def get_top_nodes(self, count: int) -> List[RetrievedChunk]:
         """Get the top N nodes by similarity score."""
-        return sorted(self.chunks, key=lambda x: x.similarity_score, reverse=True)[:count]
+        if count == 1:
+            # A single max() pass is cheaper than heap bookkeeping for the common k=1
+            return [max(self.chunks, key=lambda x: x.similarity_score)] if self.chunks else []
+        return heapq.nlargest(count, self.chunks, key=lambda x: x.similarity_score)
     
     def filter_by_similarity(self, threshold: float) -> List[RetrievedChunk]:
         """Filter nodes by minimum similarity threshold."""
@@ -93,23 +101,28 @@ class RetrievalResult:
     
     def get_sources(self) -> List[str]:
         """Get unique source references from all nodes."""
-        sources = set()
-        for node in self.chunks:
-            sources.add(node.get_source_reference())
-        return sorted(list(sources))
+        return sorted({node.get_source_reference() for node in self.chunks})
     
     def get_citation_summary(self) -> Dict[str, Any]:
         """Get a summary suitable for citation purposes."""
+        total = 0
+        similarity_sum = 0.0
+        sources = set()
+        for node in self.chunks:
+            total += 1
+            similarity_sum += node.similarity_score
+            sources.add(node.get_source_reference())
+        
         return {
-            "total_nodes": len(self.chunks),
-            "sources": self.get_sources(),
-            "avg_similarity": sum(node.similarity_score for node in self.chunks) / len(self.chunks) if self.chunks else 0.0,
+            "total_nodes": total,
+            "sources": sorted(sources),
+            "avg_similarity": similarity_sum / total if total else 0.0,
             "processing_time": self.processing_time_seconds,
             "query_metadata": self.query_metadata,
         }
 
 
-@dataclass 
+@dataclass(slots=True)
 class EmbeddingConfig:
     """Configuration for embedding models."""
     
@@ -118,7 +131,7 @@ class EmbeddingConfig:
     batch_size: int = 100
 
 
-@dataclass
+@dataclass(slots=True)
 class VectorStoreConfig:
     """Configuration for vector store connection."""
     
@@ -128,7 +141,7 @@ class VectorStoreConfig:
     environment: str = "us-east-1-aws"
 
 
-@dataclass
+@dataclass(slots=True)
 class RetrievalConfig:
     """Configuration for retrieval operations."""
     
@@ -142,6 +155,9 @@ class RetrievalConfig:
     # Performance settings
     request_timeout_seconds: float = 30.0
     max_retries: int = 3
+    # Query embeddings kept for repeated queries by each pipeline, 0 disables. A
+    # 1536-dim embedding stored as a list of floats takes about 50 KB.
+    embedding_cache_size: int = 128
     
     # Postprocessing options
     enable_similarity_filter: bool = True
@@ -153,7 +169,7 @@ class RetrievalConfig:
         if self.default_similarity_top_k <= 0:
             raise ValueError("default_similarity_top_k must be positive")
         
-        if self.default_similarity_threshold is not None and not (0.0 <= self.default_similarity_threshold <= 1.0):
+        if (threshold := self.default_similarity_threshold) is not None and (threshold < 0.0 or threshold > 1.0):
             raise ValueError("default_similarity_threshold must be between 0.0 and 1.0")
         
         if self.request_timeout_seconds <= 0:
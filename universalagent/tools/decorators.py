@@ -1,8 +1,11 @@
 import asyncio, inspect, functools
-from typing import Callable, Optional, Awaitable, Any
+from typing import Callable, Optional, Awaitable, Any, Set
 from livekit.agents import RunContext
 from universalagent.tools.tool_holder import ToolHolder
 
+# Maximum concurrently running background calls per decorated tool
+MAX_BACKGROUND_TASKS = 32
+
 
 def fire_and_forget_tool_decorator(
     *,
@@ -19,10 +22,22 @@ def fire_and_forget_tool_decorator(
     """
 
     def decorator(fn: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[str]]:
+        message = return_message or f"{fn.__name__} started in background"
+        # Per tool, like FireAndForgetToolHolder: strong references to running calls so
+        # they are not garbage collected, and a limit on how many run at once
+        background_tasks: Set[asyncio.Task] = set()
+        background_limit = asyncio.Semaphore(MAX_BACKGROUND_TASKS)
+
+        async def _run_in_background(coro: Awaitable[Any]) -> None:
+            async with background_limit:
+                await coro
+
         async def _wrapper(*args, **kwargs) -> str:
             # launch the real coroutine in the background
-            asyncio.create_task(fn(*args, **kwargs))
-            return return_message or f"{fn.__name__} started in background"
+            task = asyncio.create_task(_run_in_background(fn(*args, **kwargs)))
+            background_tasks.add(task)
+            task.add_done_callback(background_tasks.discard)
+            return message
 
         # make the wrapper indistinguishable from the original
         functools.update_wrapper(_wrapper, fn)
@@ -30,5 +45,3 @@ def fire_and_forget_tool_decorator(
         return _wrapper
 
     return decorator
-
-    return decorator
@@ -2,7 +2,9 @@ import asyncio
 from dataclasses import dataclass
 import logging
 import os
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
 
 from kb_retriever import RetrievalResult
 from kb_retriever.models.retrieval import (
@@ -21,10 +23,29 @@ from livekit.agents import RunContext
 
 logger = logging.getLogger(__name__)
 
+# Pinecone clients keyed by API key, shared by all RAG tools in the process so index
+# handles reuse one connection pool instead of opening a new one per session
+_pinecone_clients: Dict[str, Pinecone] = {}
+
+
+def _get_pinecone_client(api_key: str) -> Pinecone:
+    client = _pinecone_clients.get(api_key)
+    if client is None:
+        client = _pinecone_clients[api_key] = Pinecone(api_key=api_key)
+    return client
+
 
 @dataclass
 class RAGToolConfig:
-    """Configuration for RAG system"""
+    """Configuration for RAG system
+
+    The semantic result cache is off by default (``semantic_cache_size=0``). When
+    enabled, a query whose embedding is within ``semantic_cache_threshold`` cosine
+    similarity of an earlier one reuses that query's results. Short questions that
+    differ in one detail ("hours on Monday" vs "hours on Tuesday") can clear the
+    threshold and get each other's answers, and every query is embedded before the
+    cache lookup, so enable it only for FAQ-style knowledge bases.
+    """
 
     openai_api_key: str
     pinecone_api_key: str
@@ -34,12 +55,69 @@ class RAGToolConfig:
     similarity_top_k: int = 5
     similarity_threshold: float = 0.7
     knowledge_base_ids: Optional[List[str]] = None
+    semantic_cache_size: int = 0  # 0 disables the semantic result cache
+    semantic_cache_threshold: float = 0.95
+
+
+class _SemanticCache:
+    """Retrieval results keyed by query embedding and matched by cosine similarity.
+
+    Embeddings are stored normalized in a preallocated matrix so a lookup is a single
+    matrix-vector product; the least recently used slot is replaced once full.
+    """
+
+    def __init__(self, capacity: int, threshold: float):
+        self.capacity = capacity
+        self.threshold = threshold
+        self._matrix: Optional[np.ndarray] = None
+        self._results: List[Optional[RetrievalResult]] = [None] * capacity
+        self._last_used = np.zeros(capacity, dtype=np.int64)
+        self._size = 0
+        self._clock = 0
+
+    @staticmethod
+    def _normalize(embedding: Sequence[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _touch(self, slot: int) -> None:
+        self._clock += 1
+        self._last_used[slot] = self._clock
+
+    def get(self, embedding: Sequence[float]) -> Optional[RetrievalResult]:
+        if not self._size:
+            return None
+        similarities = self._matrix[: self._size] @ self._normalize(embedding)
+        slot = int(np.argmax(similarities))
+        if similarities[slot] < self.threshold:
+            return None
+        self._touch(slot)
+        return self._results[slot]
+
+    def put(self, embedding: Sequence[float], result: RetrievalResult) -> None:
+        vector = self._normalize(embedding)
+        if self._matrix is None:
+            self._matrix = np.zeros((self.capacity, vector.shape[0]), dtype=np.float32)
+        if self._size < self.capacity:
+            slot = self._size
+            self._size += 1
+        else:
+            slot = int(np.argmin(self._last_used))
+        self._matrix[slot] = vector
+        self._results[slot] = result
+        self._touch(slot)
 
 
 class LlamaIndexPineconeRagTool:
     def __init__(self, config: RAGToolConfig):
         self.config = config
         self.retrieval_pipeline = None
+        self._semantic_cache = (
+            _SemanticCache(config.semantic_cache_size, config.semantic_cache_threshold)
+            if config.semantic_cache_size > 0
+            else None
+        )
         # Initialize retrieval pipeline
         self._init_retrieval_pipeline()
 
@@ -55,7 +133,7 @@ class LlamaIndexPineconeRagTool:
 
             # Initialize Pinecone vector store 
             # TODO: Add namespace support
-            pc = Pinecone(api_key=self.config.pinecone_api_key)
+            pc = _get_pinecone_client(self.config.pinecone_api_key)
             pinecone_index = pc.Index(self.config.index_name)
             vector_store = PineconeVectorStore(
                 pinecone_index=pinecone_index
@@ -82,29 +160,39 @@ class LlamaIndexPineconeRagTool:
         try:
             logger.info(f"Searching knowledge base for: {query}")
 
-            # Create query request
-            query_request = QueryRequest(
-                query=query,
-                similarity_top_k=self.config.similarity_top_k,
-                similarity_threshold=self.config.similarity_threshold,
-                knowledge_base_ids=self.config.knowledge_base_ids,
-            )
+            # Near-duplicate questions are answered from the semantic cache. The
+            # pipeline caches the embedding too, so a miss does not embed twice.
+            embedding = None
+            result: Optional[RetrievalResult] = None
+            if self._semantic_cache is not None:
+                embedding = await self.retrieval_pipeline.get_query_embedding(query)
+                result = self._semantic_cache.get(embedding)
+
+            if result is None:
+                # Create query request
+                query_request = QueryRequest(
+                    query=query,
+                    similarity_top_k=self.config.similarity_top_k,
+                    similarity_threshold=self.config.similarity_threshold,
+                    knowledge_base_ids=self.config.knowledge_base_ids,
+                )
 
-            # Retrieve relevant content
-            result: RetrievalResult = await self.retrieval_pipeline.retrieve(query_request)
+                # Retrieve relevant content
+                result = await self.retrieval_pipeline.retrieve(
+                    query_request, include_metadata=False
+                )
+                if embedding is not None and result.success:
+                    self._semantic_cache.put(embedding, result)
 
             if not result.chunks:
                 return (
                     "I couldn't find specific information about that topic in our knowledge base."
                 )
 
-            # Combine results into a coherent response
-            content_parts = []
-            for i, node in enumerate(result.chunks, 1):
-                # Add some context about the source
-                content_parts.append(f"From our knowledge base: {node.content.strip()}")
-
-            combined_content = "\n\n".join(content_parts)
+            # Combine results into a coherent response, noting the source of each chunk
+            combined_content = "\n\n".join(
+                f"From our knowledge base: {node.content.strip()}" for node in result.chunks
+            )
 
             logger.info(f"Found {len(result.chunks)} relevant chunks")
             return combined_content
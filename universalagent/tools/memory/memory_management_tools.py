@@ -29,9 +29,9 @@ class MemoryManagementTool:
         """Save the memory from the messages.
         This will save the memory from the messages.
         """
-        messages_to_save = []
-        for message in messages:
-            messages_to_save.append({"role": message.role, "content": message.text_content})
+        messages_to_save = [
+            {"role": message.role, "content": message.text_content} for message in messages
+        ]
         await self.memory_manager.add(
             messages_to_save, user_id=self.user_id, agent_id=self.agent_id
         )
@@ -87,7 +87,7 @@ class MemoryManagementTool:
             )
 
             memory_prompt = f"Here are the memories for the user {self.user_id} related to the query {query}: \n"
-            memory_string = memory_prompt + "\n".join([memory["memory"] for memory in memories])
+            memory_string = memory_prompt + "\n".join(memory["memory"] for memory in memories)
             return memory_string
         except Exception as e:
             logger.error(f"Error getting memory for user {self.user_id}: {str(e)}")
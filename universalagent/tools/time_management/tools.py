@@ -6,11 +6,41 @@ in various formats and timezones.
 """
 
 import datetime
-import pytz
+import functools
 from typing import Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError, available_timezones
 from universalagent.tools.tool_holder import ToolHolder
 
 
+@functools.lru_cache(maxsize=256)
+def _tz(name: str) -> datetime.tzinfo:
+    """Resolve a timezone name once; the LLM asks for the same few zones repeatedly."""
+    return ZoneInfo(name)
+
+
+# strftime patterns for get_current_time's format_type
+_TIME_FORMATS = {
+    "full": "%A, %B %d, %Y at %I:%M %p %Z",
+    "date": "%A, %B %d, %Y",
+    "time": "%I:%M %p %Z",
+    "short": "%m/%d/%Y %I:%M %p",
+}
+
+_COMMON_TIMEZONES = (
+    "UTC",
+    "US/Eastern", "US/Central", "US/Mountain", "US/Pacific",
+    "Europe/London", "Europe/Paris", "Europe/Berlin",
+    "Asia/Tokyo", "Asia/Shanghai", "Asia/Kolkata",
+    "Australia/Sydney", "Australia/Melbourne"
+)
+_COMMON_TIMEZONES_RESPONSE = "Common timezones:\n" + "\n".join(
+    f"• {zone}" for zone in _COMMON_TIMEZONES
+)
+
+# (name, lowercased name) for every known zone, sorted by name, for region search
+_ALL_TIMEZONES_LOWER = tuple((tz, tz.lower()) for tz in sorted(available_timezones()))
+
+
 async def get_current_time(
     timezone: Optional[str] = None,
     format_type: str = "full"
@@ -29,28 +59,18 @@ async def get_current_time(
         # Get current time
         if timezone:
             try:
-                tz = pytz.timezone(timezone)
+                tz = _tz(timezone)
                 now = datetime.datetime.now(tz)
-            except pytz.exceptions.UnknownTimeZoneError:
+            except (ZoneInfoNotFoundError, ValueError):
                 # Fallback to UTC if timezone is invalid
-                now = datetime.datetime.now(pytz.UTC)
+                now = datetime.datetime.now(datetime.timezone.utc)
                 timezone = "UTC (invalid timezone specified)"
         else:
-            now = datetime.datetime.now(pytz.UTC)
+            now = datetime.datetime.now(datetime.timezone.utc)
             timezone = "UTC"
         
-        # Format based on type
-        if format_type == "full":
-            formatted_time = now.strftime("%A, %B %d, %Y at %I:%M %p %Z")
-        elif format_type == "date":
-            formatted_time = now.strftime("%A, %B %d, %Y")
-        elif format_type == "time":
-            formatted_time = now.strftime("%I:%M %p %Z")
-        elif format_type == "short":
-            formatted_time = now.strftime("%m/%d/%Y %I:%M %p")
-        else:
-            # Default to full format
-            formatted_time = now.strftime("%A, %B %d, %Y at %I:%M %p %Z")
+        # Format based on type, defaulting to the full format
+        formatted_time = now.strftime(_TIME_FORMATS.get(format_type, _TIME_FORMATS["full"]))
         
         return f"Current time ({timezone}): {formatted_time}"
         
@@ -70,36 +90,23 @@ async def get_timezones_for_region(region: str = "") -> str:
     """
     try:
         if not region:
-            # Return common timezones
-            common_zones = [
-                "UTC",
-                "US/Eastern", "US/Central", "US/Mountain", "US/Pacific",
-                "Europe/London", "Europe/Paris", "Europe/Berlin",
-                "Asia/Tokyo", "Asia/Shanghai", "Asia/Kolkata",
-                "Australia/Sydney", "Australia/Melbourne"
-            ]
-            result = "Common timezones:\n"
-            for zone in common_zones:
-                result += f"• {zone}\n"
-            return result.strip()
+            return _COMMON_TIMEZONES_RESPONSE
         
         # Filter timezones by region
-        all_timezones = pytz.all_timezones
-        region_timezones = [tz for tz in all_timezones if region.lower() in tz.lower()]
+        region_lower = region.lower()
+        region_timezones = [tz for tz, tz_lower in _ALL_TIMEZONES_LOWER if region_lower in tz_lower]
         
         if not region_timezones:
             return f"No timezones found for region '{region}'. Try 'US', 'Europe', 'Asia', 'America', or 'Australia'."
         
         # Limit to first 20 results to avoid overwhelming output
-        limited_zones = sorted(region_timezones)[:20]
-        result = f"Timezones for '{region}' (showing first 20):\n"
-        for zone in limited_zones:
-            result += f"• {zone}\n"
+        listing = "\n".join(f"• {zone}" for zone in region_timezones[:20])
+        result = f"Timezones for '{region}' (showing first 20):\n{listing}"
         
         if len(region_timezones) > 20:
-            result += f"... and {len(region_timezones) - 20} more"
+            result += f"\n... and {len(region_timezones) - 20} more"
         
-        return result.strip()
+        return result
         
     except Exception as e:
         return f"Error getting timezones for region: {str(e)}"
@@ -120,10 +127,10 @@ async def get_time_difference(
     """
     try:
         # Get current time in both timezones
-        tz1 = pytz.timezone(timezone1)
-        tz2 = pytz.timezone(timezone2)
+        tz1 = _tz(timezone1)
+        tz2 = _tz(timezone2)
         
-        now = datetime.datetime.now(pytz.UTC)
+        now = datetime.datetime.now(datetime.timezone.utc)
         time1 = now.astimezone(tz1)
         time2 = now.astimezone(tz2)
         
@@ -143,7 +150,7 @@ async def get_time_difference(
         
         return f"Time comparison:\n• {timezone1}: {time1_str}\n• {timezone2}: {time2_str}\n• {diff_str}"
         
-    except pytz.exceptions.UnknownTimeZoneError as e:
+    except (ZoneInfoNotFoundError, ValueError) as e:
         return f"Invalid timezone specified: {str(e)}"
     except Exception as e:
         return f"Error calculating time difference: {str(e)}"
@@ -1,4 +1,4 @@
-from typing import Callable, Optional, Any, Awaitable
+from typing import Callable, Optional, Any, Awaitable, Set
 import asyncio
 import logging
 from livekit.agents import function_tool, RunContext, FunctionTool
@@ -8,6 +8,8 @@ logger = logging.getLogger(__name__)
 
 
 class ToolHolder:
+    __slots__ = ("fnc", "name", "description", "_usage_instructions_llm", "_livekit_tool")
+
     def __init__(
         self,
         fnc: Callable | FunctionTool,
@@ -26,16 +28,20 @@ class ToolHolder:
             self.description = description
 
         self._usage_instructions_llm = usage_instructions_llm
+        self._livekit_tool: Optional[FunctionTool] = None
 
     @property
     def livekit_tool(self):
         if isinstance(self.fnc, FunctionTool):
             return self.fnc
-        return function_tool(
-            self.fnc,
-            name=self.name,
-            description=self.description,
-        )
+        # Built once: agents read this for every session they start
+        if self._livekit_tool is None:
+            self._livekit_tool = function_tool(
+                self.fnc,
+                name=self.name,
+                description=self.description,
+            )
+        return self._livekit_tool
 
     @property
     def usage_instructions_llm(self):
@@ -49,6 +55,8 @@ class FireAndForgetToolHolder(ToolHolder):
     or any operation that can run asynchronously without blocking the main execution flow.
     """
 
+    __slots__ = ("original_fnc", "_background_tasks")
+
     def __init__(
         self,
         fnc: Callable[..., Awaitable[Any]],
@@ -67,13 +75,16 @@ class FireAndForgetToolHolder(ToolHolder):
 
         # Create a wrapper function that runs the original function in the background
         async def fire_and_forget_wrapper(ctx: RunContext, *args, **kwargs) -> str:
-            # Start the task but don't await it
-            asyncio.create_task(self._execute_and_log(fnc, ctx, *args, **kwargs))
+            # Start the task but don't await it; keep a reference so it isn't garbage collected
+            task = asyncio.create_task(self._execute_and_log(fnc, ctx, *args, **kwargs))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
             # Return immediately
             return f"Operation {name or fnc.__name__} started in the background"
 
         # Store the original function for reference
         self.original_fnc = fnc
+        self._background_tasks: Set[asyncio.Task] = set()
 
         # Pass the wrapper to the parent class
         super().__init__(
@@ -6,10 +6,51 @@ This module provides formatters to convert transcripts into
 readable formats like markdown and HTML.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from universalagent.transcripts.models import Transcript, TranscriptMessage
 
 
+def _message_stats(messages: List[TranscriptMessage]) -> Tuple[int, int, int, int]:
+    """Count total, customer, agent and interrupted messages in one pass."""
+    total = user = assistant = interrupted = 0
+    for message in messages:
+        total += 1
+        role = message.role
+        if role == "user":
+            user += 1
+        elif role == "assistant":
+            assistant += 1
+        if message.interrupted:
+            interrupted += 1
+    return total, user, assistant, interrupted
+
+
+# Static parts of the HTML document, joined once at import
+_HTML_DOCUMENT_START = "<!DOCTYPE html>\n<html>\n<head>"
+_HTML_STYLE_AND_HEADER = "\n".join(
+    [
+        "<style>",
+        "body { font-family: Arial, sans-serif; margin: 20px; }",
+        "h1 { color: #333; }",
+        ".metadata { background: #f5f5f5; padding: 15px; border-radius: 5px; margin-bottom: 20px; }",
+        ".conversation { margin-bottom: 20px; }",
+        ".message { margin-bottom: 10px; padding: 8px; border-radius: 5px; }",
+        ".assistant { background: #e6f7ff; border-left: 4px solid #1890ff; }",
+        ".user { background: #f6ffed; border-left: 4px solid #52c41a; }",
+        ".system { background: #fff7e6; border-left: 4px solid #faad14; }",
+        ".function { background: #f9f0ff; border-left: 4px solid #722ed1; }",
+        ".interrupted { font-style: italic; color: #f5222d; }",
+        ".stats { background: #f5f5f5; padding: 15px; border-radius: 5px; }",
+        "</style>",
+        "</head>",
+        "<body>",
+        "<h1>Call Transcript</h1>",
+        "<div class='metadata'>",
+    ]
+)
+_HTML_INTERRUPTED = "\n<span class='interrupted'> (interrupted)</span>"
+
+
 class MarkdownFormatter:
     """Formats transcripts as Markdown text."""
 
@@ -59,32 +100,32 @@ class MarkdownFormatter:
         # Add the conversation
         markdown_lines.extend(["", "## Conversation", ""])
 
+        speakers = {
+            "assistant": f"**{metadata.agent_name}:**",
+            "user": f"**{metadata.customer_name or 'Customer'}:**",
+        }
         for message in transcript.messages:
             # Format based on role
-            if message.role == "assistant":
-                speaker = f"**{metadata.agent_name}:**"
-            elif message.role == "user":
-                speaker = f"**{metadata.customer_name or 'Customer'}:**"
-            else:
-                speaker = f"**{message.role.title()}:**"
+            speaker = speakers[message.role] if message.role in speakers else f"**{message.role.title()}:**"
 
             # Add interrupted indicator if applicable
             interrupted_indicator = " *(interrupted)*" if message.interrupted else ""
 
-            markdown_lines.append(f"{speaker} {message.content}{interrupted_indicator}")
-            markdown_lines.append("")
+            # The trailing newline leaves a blank line between messages once joined
+            markdown_lines.append(f"{speaker} {message.content}{interrupted_indicator}\n")
 
         # Add stats
+        total, user, assistant, interrupted = _message_stats(transcript.messages)
         markdown_lines.extend(
             [
                 "---",
                 "",
                 "## Call Statistics",
                 "",
-                f"- **Total Messages:** {len(transcript.messages)}",
-                f"- **Customer Messages:** {sum(1 for m in transcript.messages if m.role == 'user')}",
-                f"- **Agent Messages:** {sum(1 for m in transcript.messages if m.role == 'assistant')}",
-                f"- **Interruptions:** {sum(1 for m in transcript.messages if m.interrupted)}",
+                f"- **Total Messages:** {total}",
+                f"- **Customer Messages:** {user}",
+                f"- **Agent Messages:** {assistant}",
+                f"- **Interruptions:** {interrupted}",
             ]
         )
 
@@ -107,27 +148,9 @@ class HTMLFormatter:
 
         # Basic HTML structure
         html = [
-            "<!DOCTYPE html>",
-            "<html>",
-            "<head>",
+            _HTML_DOCUMENT_START,
             f"<title>Transcript: {metadata.call_id}</title>",
-            "<style>",
-            "body { font-family: Arial, sans-serif; margin: 20px; }",
-            "h1 { color: #333; }",
-            ".metadata { background: #f5f5f5; padding: 15px; border-radius: 5px; margin-bottom: 20px; }",
-            ".conversation { margin-bottom: 20px; }",
-            ".message { margin-bottom: 10px; padding: 8px; border-radius: 5px; }",
-            ".assistant { background: #e6f7ff; border-left: 4px solid #1890ff; }",
-            ".user { background: #f6ffed; border-left: 4px solid #52c41a; }",
-            ".system { background: #fff7e6; border-left: 4px solid #faad14; }",
-            ".function { background: #f9f0ff; border-left: 4px solid #722ed1; }",
-            ".interrupted { font-style: italic; color: #f5222d; }",
-            ".stats { background: #f5f5f5; padding: 15px; border-radius: 5px; }",
-            "</style>",
-            "</head>",
-            "<body>",
-            f"<h1>Call Transcript</h1>",
-            "<div class='metadata'>",
+            _HTML_STYLE_AND_HEADER,
             f"<p><strong>Call ID:</strong> {metadata.call_id}</p>",
             f"<p><strong>Agent:</strong> {metadata.agent_name}</p>",
         ]
@@ -164,49 +187,38 @@ class HTMLFormatter:
         html.append("<h2>Conversation</h2>")
         html.append("<div class='conversation'>")
 
+        speakers = {
+            "assistant": metadata.agent_name,
+            "user": metadata.customer_name or "Customer",
+        }
         for message in transcript.messages:
-            # Determine CSS class based on role
-            css_class = message.role
-
-            # Get speaker name
-            if message.role == "assistant":
-                speaker = metadata.agent_name
-            elif message.role == "user":
-                speaker = metadata.customer_name or "Customer"
-            else:
-                speaker = message.role.title()
-
-            # Add message
-            html.append(f"<div class='message {css_class}'>")
-            html.append(f"<p><strong>{speaker}:</strong> {message.content}")
-
-            # Add interrupted indicator if applicable
-            if message.interrupted:
-                html.append("<span class='interrupted'> (interrupted)</span>")
-
-            html.append("</p>")
-            html.append("</div>")
+            # CSS class is the role; speaker name falls back to the role for other roles
+            speaker = speakers[message.role] if message.role in speakers else message.role.title()
+            interrupted = _HTML_INTERRUPTED if message.interrupted else ""
+            html.append(
+                f"<div class='message {message.role}'>\n"
+                f"<p><strong>{speaker}:</strong> {message.content}{interrupted}\n"
+                "</p>\n</div>"
+            )
 
         html.append("</div>")
 
-        # Add stats
-        html.append("<h2>Call Statistics</h2>")
-        html.append("<div class='stats'>")
-        html.append("<ul>")
-        html.append(f"<li><strong>Total Messages:</strong> {len(transcript.messages)}</li>")
-        html.append(
-            f"<li><strong>Customer Messages:</strong> {sum(1 for m in transcript.messages if m.role == 'user')}</li>"
-        )
-        html.append(
-            f"<li><strong>Agent Messages:</strong> {sum(1 for m in transcript.messages if m.role == 'assistant')}</li>"
-        )
-        html.append(
-            f"<li><strong>Interruptions:</strong> {sum(1 for m in transcript.messages if m.interrupted)}</li>"
+        # Add stats and close HTML
+        total, user, assistant, interrupted = _message_stats(transcript.messages)
+        html.extend(
+            [
+                "<h2>Call Statistics</h2>",
+                "<div class='stats'>",
+                "<ul>",
+                f"<li><strong>Total Messages:</strong> {total}</li>",
+                f"<li><strong>Customer Messages:</strong> {user}</li>",
+                f"<li><strong>Agent Messages:</strong> {assistant}</li>",
+                f"<li><strong>Interruptions:</strong> {interrupted}</li>",
+                "</ul>",
+                "</div>",
+                "</body>",
+                "</html>",
+            ]
         )
-        html.append("</ul>")
-        html.append("</div>")
-
-        # Close HTML
-        html.extend(["</body>", "</html>"])
 
         return "\n".join(html)
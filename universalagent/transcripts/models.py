@@ -7,35 +7,66 @@ formatting, and transmission to webhook endpoints.
 """
 
 from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, Final, List, Any, Optional
 from datetime import datetime
-from enum import Enum
-import json
+import itertools
+import logging
+import os
+import time
 
+import orjson
 
-class MessageRole(str, Enum):
-    """Roles in conversation messages."""
+from universalagent.core.serialization import dumps_json
 
-    SYSTEM = "system"
-    ASSISTANT = "assistant"
-    USER = "user"
-    FUNCTION = "function"
+logger = logging.getLogger(__name__)
 
+# Event ids are a per-process prefix (start epoch and pid) plus a counter: unique
+# even for several events in the same second, and cheap to generate
+_event_id_prefix = ""
+_event_counter = itertools.count()
 
-@dataclass
+
+def _reset_event_ids() -> None:
+    global _event_id_prefix, _event_counter
+    _event_id_prefix = f"evt_{int(time.time())}_{os.getpid()}_"
+    _event_counter = itertools.count()
+
+
+_reset_event_ids()
+# Job processes forked from a warmed-up worker must not reuse the parent's ids
+# (fork hooks do not exist on Windows, where processes are always spawned)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_event_ids)
+
+
+def _next_event_id() -> str:
+    return f"{_event_id_prefix}{next(_event_counter)}"
+
+
+class MessageRole:
+    """Roles in conversation messages.
+
+    Plain string constants rather than an Enum: messages store the raw role string,
+    so comparisons need no Enum lookup or conversion.
+    """
+
+    SYSTEM: Final = "system"
+    ASSISTANT: Final = "assistant"
+    USER: Final = "user"
+    FUNCTION: Final = "function"
+
+
+@dataclass(slots=True)
 class TranscriptMessage:
     """Represents a single message in a transcript."""
 
     role: str
-    content: Union[str, List[str]]
+    content: str
     interrupted: bool = False
     timestamp: Optional[datetime] = None
 
     def __post_init__(self):
-        """Convert content to string if it's a list."""
-        if isinstance(self.content, list):
-            self.content = " ".join(self.content)
-
+        """Set timestamp if not provided."""
         if self.timestamp is None:
             self.timestamp = datetime.now()
 
@@ -49,7 +80,7 @@ class TranscriptMessage:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptMetadata:
     """Metadata about a transcript."""
 
@@ -91,71 +122,100 @@ class TranscriptMetadata:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Transcript:
     """Complete transcript data."""
 
     metadata: TranscriptMetadata
     messages: List[TranscriptMessage] = field(default_factory=list)
-    raw_history: Optional[Dict[str, Any]] = None
+    # Kept JSON-encoded: a dict would hold a second in-memory copy of the whole
+    # session for the transcript's lifetime, while it is rarely serialized
+    raw_history: Optional[bytes] = None
+
+    def __post_init__(self):
+        """Encode a raw history given as a dict."""
+        if isinstance(self.raw_history, dict):
+            try:
+                # Unknown objects in the history are stringified rather than failing
+                self.raw_history = orjson.dumps(
+                    self.raw_history, default=str, option=orjson.OPT_NON_STR_KEYS
+                )
+            except orjson.JSONEncodeError as e:
+                logger.warning(f"Dropping raw history that could not be encoded: {e}")
+                self.raw_history = None
 
     def add_messages(self, messages: List[TranscriptMessage]) -> None:
-        """Add a message to the transcript."""
+        """Add messages to the transcript."""
         self.messages.extend(messages)
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        return {
+    def to_dict(self, include_raw: bool = False) -> Dict[str, Any]:
+        """Convert to dictionary.
+
+        Args:
+            include_raw: Also emit raw_history. It is the full LiveKit session dump
+                and mostly duplicates messages, so it is left out by default.
+        """
+        data = {
             "metadata": self.metadata.to_dict(),
             "messages": [msg.to_dict() for msg in self.messages],
-            "raw_history": self.raw_history,
         }
+        if include_raw:
+            raw = self.raw_history
+            data["raw_history"] = orjson.loads(raw) if raw is not None else None
+        return data
 
-    def to_json(self, indent: int = 2) -> str:
+    def to_json(self, indent: int = 2, include_raw: bool = False) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict(), indent=indent)
+        return dumps_json(self.to_dict(include_raw), indent)
 
     @classmethod
     def from_livekit_history(
         cls, history: Dict[str, Any], metadata: TranscriptMetadata
     ) -> "Transcript":
         """Create a Transcript from LiveKit session history."""
-        transcript = cls(metadata=metadata, raw_history=history)
-
-        if "items" in history:
-            for item in history["items"]:
-                if item.get("type") == "message":
-                    role = item.get("role", "unknown")
-                    content = item.get("content", [])
-                    interrupted = item.get("interrupted", False)
-
-                    # Create a TranscriptMessage from the history item
-                    message = TranscriptMessage(role=role, content=content, interrupted=interrupted)
-                    transcript.add_message(message)
-
-        return transcript
-
-
-@dataclass
+        messages = [
+            TranscriptMessage(
+                role=item.get("role", "unknown"),
+                # LiveKit stores message content as a list of text parts
+                content=" ".join(c) if type(c := item.get("content", "")) is list else c,
+                interrupted=item.get("interrupted", False),
+            )
+            for item in history.get("items", ())
+            if item.get("type") == "message"
+        ]
+        return cls(metadata=metadata, messages=messages, raw_history=history)
+
+
+@dataclass(slots=True)
 class TranscriptWebhookPayload:
     """Payload for webhook transmission."""
 
     transcript: Transcript
     event_type: str = "transcript.complete"
-    event_id: str = field(default_factory=lambda: f"evt_{int(datetime.now().timestamp())}")
+    event_id: str = field(default_factory=_next_event_id)
     timestamp: datetime = field(default_factory=datetime.now)
     formatted_transcript: Optional[str] = None
+    include_raw_history: bool = False
+    _dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        return {
+        """Convert to dictionary.
+
+        The payload is not modified after construction, so the dictionary is built
+        once and shared by later calls (retries, to_json); callers must not mutate it.
+        """
+        if self._dict is not None:
+            return self._dict
+
+        self._dict = {
             "event_type": self.event_type,
             "event_id": self.event_id,
             "timestamp": self.timestamp.isoformat(),
-            "transcript": self.transcript.to_dict(),
+            "transcript": self.transcript.to_dict(self.include_raw_history),
             "formatted_transcript": self.formatted_transcript,
         }
+        return self._dict
 
     def to_json(self, indent: int = 2) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict(), indent=indent)
+        return dumps_json(self.to_dict(), indent)